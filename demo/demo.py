@@ -12,19 +12,33 @@ json_message = Path('message.json').read_text(encoding='utf-8')
 
 
 class SearchResultHandler(JSONParserHandler):
+    def __init__(self):
+        # Field name -> printer, so each field_end is one dict lookup
+        self._field_end_printers = {
+            "title": self._print_title,
+            "heading": self._print_heading,
+            "content": self._print_content_end,
+        }
+
     def on_field_start(self, path: str, field_name: str):
         if field_name == "references":
             level = path.count("/") + 2
             print(f"\n{'#' * level} References\n")
 
     def on_field_end(self, path, field_name, value, parsed_value=None):
-        if field_name == "title" and path == "":
-                print(f"# {value}")
+        printer = self._field_end_printers.get(field_name)
+        if printer is not None:
+            printer(path, value)
+
+    def _print_title(self, path, value):
+        if path == "":
+            print(f"# {value}")
+
+    def _print_heading(self, path, value):
+        print(f"\n\n## {value}\n")
 
-        elif field_name == "heading":
-            print(f"\n\n## {value}\n")
-        elif field_name == "content":
-            print("\n") 
+    def _print_content_end(self, path, value):
+        print("\n")
 
     def on_value_chunk(self, path, field_name, chunk):
         if field_name == "content":
@@ -37,7 +51,7 @@ class SearchResultHandler(JSONParserHandler):
             print(f"- [{title}]({filename})")
 
 handler = SearchResultHandler()
-parser = StreamingJSONParser(handler)
+parser = StreamingJSONParser(handler, chunk_size=64)
 
 for i in range(0, len(json_message), 4):
     chunk = json_message[i:i+4]
@@ -5,6 +5,12 @@ This class holds the temporary buffers used during JSON parsing
 for accumulating field names, string values, and escape sequences.
 """
 
+from typing import List, Optional
+
+
+# Value of each hexadecimal digit accepted in a \uXXXX escape
+_HEX_DIGITS = {c: int(c, 16) for c in '0123456789abcdefABCDEF'}
+
 
 class Buffers:
     r"""
@@ -12,51 +18,96 @@ class Buffers:
 
     The buffer is used to accumulate characters during parsing,
     such as field names, string values, and primitive values.
-    The unicode buffer is used specifically for accumulating
-    the 4 hex digits of unicode escape sequences (\uXXXX).
+    The hex digits of unicode escape sequences (\uXXXX) are accumulated
+    directly into an integer code point, with unicode_value set to None
+    once a character that is not a hex digit is seen.
+
+    Characters are collected in a list and only joined into a string
+    when the buffer is read, so long values are built in linear time.
+    The joined string is cached until the next modification.
     """
 
+    __slots__ = ('_parts', '_joined', 'unicode_value', 'unicode_length')
+
     def __init__(self):
-        self._buffer: str = ""
-        self._unicode_buf: str = ""
+        self._parts: List[str] = []
+        self._joined: Optional[str] = ""
+        self.unicode_value: Optional[int] = 0
+        self.unicode_length: int = 0
 
     @property
     def buffer(self) -> str:
         """Get the main parsing buffer."""
-        return self._buffer
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+        return self._joined
 
     @buffer.setter
     def buffer(self, value: str) -> None:
         """Set the main parsing buffer."""
-        self._buffer = value
-
-    @property
-    def unicode_buffer(self) -> str:
-        """Get the unicode escape sequence buffer."""
-        return self._unicode_buf
-
-    @unicode_buffer.setter
-    def unicode_buffer(self, value: str) -> None:
-        """Set the unicode escape sequence buffer."""
-        self._unicode_buf = value
+        self._parts = [value]
+        self._joined = value
 
     def append_to_buffer(self, char: str) -> None:
         """Add a character to the main buffer."""
-        self._buffer += char
+        self._parts.append(char)
+        self._joined = None
 
     def append_to_unicode_buffer(self, char: str) -> None:
-        """Add a character to the unicode buffer."""
-        self._unicode_buf += char
+        """Add a hex digit to the unicode escape being accumulated."""
+        value = self.unicode_value
+        digit = _HEX_DIGITS.get(char)
+        if value is None or digit is None:
+            self.unicode_value = None
+        else:
+            self.unicode_value = (value << 4) | digit
+        self.unicode_length += 1
+
+    def append_hex_digits(self, digits: str) -> None:
+        """Add a run of hex digits to the unicode escape being accumulated."""
+        if self.unicode_value is not None:
+            self.unicode_value = (self.unicode_value << (4 * len(digits))) | int(digits, 16)
+        self.unicode_length += len(digits)
+
+    def buffer_tail(self, count: int) -> str:
+        """Get the last count characters of the main buffer without joining all of it."""
+        if count <= 0:
+            return ""
+        if self._joined is not None:
+            return self._joined[-count:]
+        tail = []
+        needed = count
+        for part in reversed(self._parts):
+            if needed <= 0:
+                break
+            piece = part[-needed:]
+            tail.append(piece)
+            needed -= len(piece)
+        return "".join(reversed(tail))
+
+    def replace_buffer_tail(self, count: int, text: str) -> None:
+        """Replace the last count characters of the main buffer with text."""
+        parts = self._parts
+        while count > 0 and parts:
+            last = parts.pop()
+            if len(last) > count:
+                parts.append(last[:-count])
+                break
+            count -= len(last)
+        parts.append(text)
+        self._joined = None
 
     def clear_buffer(self) -> None:
         """Clear the main buffer."""
-        self._buffer = ""
+        self._parts = []
+        self._joined = ""
 
     def clear_unicode_buffer(self) -> None:
         """Clear the unicode buffer."""
-        self._unicode_buf = ""
+        self.unicode_value = 0
+        self.unicode_length = 0
 
     def clear_all(self) -> None:
         """Clear all buffers."""
-        self._buffer = ""
-        self._unicode_buf = ""
+        self.clear_buffer()
+        self.clear_unicode_buffer()
@@ -6,139 +6,110 @@ from the parsed context buffer.
 """
 
 import json as json_module
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .scanner import (
+    find_array_end,
+    find_last_not_in,
+    find_opening,
+    find_primitive_start,
+    find_string_start,
+)
 
 if TYPE_CHECKING:
     from .context import Context
 
 
+# Raised by scan_once for text that does not decode: no value at the
+# index, malformed JSON, integers over the digit limit, or nesting deeper
+# than the recursion limit
+_DECODE_ERRORS = (StopIteration, ValueError, RecursionError)
+
+# Characters skipped after the last array item
+_ITEM_TRAILER = ',] \t\n\r'
+
+
 class JSONExtractor:
     """
     Extract JSON values from a context object.
 
     This class is used by the parser to extract complete JSON values
     (objects, arrays, strings, primitives) from the recent context.
+
+    Values the parser is closing are decoded in place: the parser records
+    where each array and each object inside an array starts, and the
+    closing bracket is the last character of the context.
     """
 
+    __slots__ = ('context', '_decoder', '_scan_once')
+
     def __init__(self, context: 'Context'):
         self.context = context
+        self._decoder = json_module.JSONDecoder()
+        # The decoder's scanner (the C one when available) decodes a value
+        # at an index and returns (value, end), raising StopIteration if
+        # no value starts there
+        self._scan_once = self._decoder.scan_once
 
     def extract_last_object(self) -> Optional[Dict]:
         """Extract the last complete JSON object from the context."""
-        bracket_count = 0
-        start_pos = -1
-
-        for i in range(len(self.context) - 1, -1, -1):
-            ch = self.context[i]
-            if ch == '}':
-                bracket_count += 1
-            elif ch == '{':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    start_pos = i
-                    break
-
+        s = self.context.content
+        end_pos = s.rfind('}') + 1
+        if end_pos == 0:
+            return None
+        start_pos = find_opening(s, end_pos, '{', '}')
         if start_pos < 0:
             return None
+        return self._decode_span(s, start_pos, end_pos)
 
-        bracket_count = 0
-        end_pos = start_pos
-        for i in range(start_pos, len(self.context)):
-            ch = self.context[i]
-            if ch == '{':
-                bracket_count += 1
-            elif ch == '}':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    end_pos = i + 1
-                    break
-
-        try:
-            return json_module.loads(self.context[start_pos:end_pos])
-        except:
-            return None
+    def extract_object_at_position(self, start_pos: int) -> Optional[Dict]:
+        """Extract the object starting at start_pos and ending the context."""
+        s = self.context.content
+        return self._decode_span(s, start_pos, len(s))
 
     def extract_last_array_item(self) -> Any:
         """Extract the last item from an array (object, array, string, or primitive)."""
-        if not self.context:
+        s = self.context.content
+        if not s:
             return None
 
-        pos = len(self.context) - 1
-        while pos >= 0 and self.context[pos] in ',] \t\n\r':
-            pos -= 1
+        pos = find_last_not_in(s, len(s), _ITEM_TRAILER)
         if pos < 0:
             return None
 
-        last_char = self.context[pos]
+        last_char = s[pos]
 
         if last_char == '}':
             return self.extract_last_object()
 
         if last_char == ']':
-            return self._extract_nested_array(pos)
+            return self._extract_nested_array(s, pos)
 
         if last_char == '"':
-            return self._extract_quoted_string(pos)
+            return self._extract_quoted_string(s, pos)
 
-        return self._extract_primitive(pos)
+        return self._extract_primitive(s, pos)
 
-    def _extract_nested_array(self, pos: int) -> Optional[List]:
+    def _extract_nested_array(self, s: str, pos: int) -> Optional[List]:
         """Extract a nested array ending at position pos."""
-        bracket_count = 0
-        start_pos = -1
-        for i in range(pos, -1, -1):
-            ch = self.context[i]
-            if ch == ']':
-                bracket_count += 1
-            elif ch == '[':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    start_pos = i
-                    break
+        start_pos = find_opening(s, pos + 1, '[', ']')
         if start_pos >= 0:
-            try:
-                return json_module.loads(self.context[start_pos:pos + 1])
-            except:
-                return None
+            return self._decode_span(s, start_pos, pos + 1)
         return None
 
-    def _extract_quoted_string(self, pos: int) -> Optional[str]:
+    def _extract_quoted_string(self, s: str, pos: int) -> Optional[str]:
         """Extract a quoted string ending at position pos."""
-        escape_next = False
-        start_pos = pos
-        for i in range(pos - 1, -1, -1):
-            ch = self.context[i]
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == '\\':
-                escape_next = True
-                continue
-            if ch == '"':
-                start_pos = i
-                break
-        try:
-            return json_module.loads(self.context[start_pos:pos + 1])
-        except:
-            return None
+        start_pos = find_string_start(s, pos)
+        if start_pos < 0:
+            start_pos = pos
+        return self._decode_span(s, start_pos, pos + 1)
 
-    def _extract_primitive(self, pos: int) -> Any:
+    def _extract_primitive(self, s: str, pos: int) -> Any:
         """Extract a primitive value (number, boolean, null) ending at position pos."""
         end_pos = pos + 1
-        start_pos = pos
-        while start_pos > 0:
-            ch = self.context[start_pos - 1]
-            if ch in ',:[ \t\n\r':
-                break
-            start_pos -= 1
-
-        json_str = self.context[start_pos:end_pos].strip()
-        if not json_str:
-            return None
-        try:
-            return json_module.loads(json_str)
-        except:
-            return None
+        start_pos = find_primitive_start(s, end_pos)
+
+        return self._decode_span(s, start_pos, end_pos)
 
     def extract_array_at_position(self, start_pos: int) -> Optional[List]:
         """
@@ -146,35 +117,10 @@ class JSONExtractor:
 
         Finds the matching closing bracket and returns the parsed array.
         """
-        bracket_count = 0
-        end_pos = len(self.context)
-        in_string = False
-        escape_next = False
-
-        for i in range(start_pos, len(self.context)):
-            ch = self.context[i]
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == '\\':
-                escape_next = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if not in_string:
-                if ch == '[':
-                    bracket_count += 1
-                elif ch == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        end_pos = i + 1
-                        break
+        s = self.context.content
+        end_pos = find_array_end(s, start_pos)
 
-        try:
-            return json_module.loads(self.context[start_pos:end_pos])
-        except:
-            return None
+        return self._decode_span(s, start_pos, end_pos)
 
     def extract_array_string_at_position(self, start_pos: int) -> str:
         """
@@ -182,29 +128,34 @@ class JSONExtractor:
 
         Returns the content between the opening and closing brackets.
         """
-        bracket_count = 0
-        end_pos = len(self.context)
-        in_string = False
-        escape_next = False
-
-        for i in range(start_pos, len(self.context)):
-            ch = self.context[i]
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == '\\':
-                escape_next = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if not in_string:
-                if ch == '[':
-                    bracket_count += 1
-                elif ch == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        end_pos = i + 1
-                        break
-
-        return self.context[start_pos + 1:end_pos - 1] if end_pos > start_pos + 1 else ""
+        s = self.context.content
+        end_pos = find_array_end(s, start_pos)
+
+        return s[start_pos + 1:end_pos - 1] if end_pos > start_pos + 1 else ""
+
+    def extract_array_and_string_at_position(
+        self, start_pos: int, end_pos: Optional[int] = None
+    ) -> Tuple[str, Optional[List]]:
+        """
+        Extract both the inner content string and the parsed array at once.
+
+        end_pos is the position just past the closing bracket; if it is not
+        given, the closing bracket is found by scanning. Only the inner
+        string is sliced; the array is decoded in place.
+        """
+        s = self.context.content
+        if end_pos is None:
+            end_pos = find_array_end(s, start_pos)
+
+        inner = s[start_pos + 1:end_pos - 1] if end_pos > start_pos + 1 else ""
+        return inner, self._decode_span(s, start_pos, end_pos)
+
+    def _decode_span(self, s: str, start_pos: int, end_pos: int) -> Any:
+        """Decode the value at s[start_pos:end_pos] without slicing it out."""
+        try:
+            value, decoded_end = self._scan_once(s, start_pos)
+        except _DECODE_ERRORS:
+            return None
+        if decoded_end != end_pos:
+            return None
+        return value
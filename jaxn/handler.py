@@ -17,12 +17,14 @@ class JSONParserHandler:
         """Called when starting to read a field value."""
         pass
 
-    def on_field_end(self, path: str, field_name: str, value: str, parsed_value: Any = None) -> None:
+    def on_field_end(
+        self, path: str, field_name: str, value: str, parsed_value: Any = None
+    ) -> None:
         """Called when a field value is complete."""
         pass
 
     def on_value_chunk(self, path: str, field_name: str, chunk: str) -> None:
-        """Called for each character as string values stream in."""
+        """Called as string values stream in (per character unless chunk_size is set)."""
         pass
 
     def on_array_item_start(self, path: str, field_name: str) -> None:
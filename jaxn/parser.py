@@ -2,13 +2,40 @@
 Streaming JSON Parser - Main parser class using state machine pattern.
 
 Parse JSON incrementally using an explicit state machine where each state
-is an object with a handle() method that processes characters.
+is an object with a handle() method that processes characters. Runs of
+characters a state treats uniformly are passed to its handle_run() at once.
 """
 
+import codecs
+from collections import deque
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
 from .buffers import Buffers
 from .handler import JSONParserHandler
 from .tracker import Tracker
-from .states import ParserState, RootState
+from .states import (
+    AfterColonState,
+    AfterFieldNameState,
+    EscapeState,
+    FieldNameState,
+    InArrayWaitState,
+    InObjectWaitState,
+    ParserState,
+    PrimitiveState,
+    RootState,
+)
+
+
+# Input types decoded as UTF-8 by parse_incremental
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _overrides(handler: JSONParserHandler, name: str) -> bool:
+    """Check whether the handler replaces the no-op base callback name."""
+    if name in getattr(handler, '__dict__', ()):
+        return True
+    return getattr(type(handler), name, None) is not getattr(JSONParserHandler, name)
 
 
 class StreamingJSONParser:
@@ -17,14 +44,45 @@ class StreamingJSONParser:
 
     Each state is an object with a handle() method that processes characters
     and determines state transitions.
-    """
 
-    def __init__(self, handler: JSONParserHandler = None):
-        self.handler = handler or JSONParserHandler()
+    By default on_value_chunk fires once per character. With chunk_size > 1
+    the streamed characters are collected and delivered in larger chunks:
+    whenever chunk_size characters are pending, when the string ends, and
+    at the end of every parse_incremental call. With chunk_size=None each
+    string value is delivered in a single call when it ends.
+
+    Callbacks the handler does not override are never called, and the work
+    done only to produce their arguments is skipped: field values are only
+    decoded for on_field_end or a registered callback, array items are only
+    extracted for on_array_item_end, and streamed text is only assembled
+    for on_value_chunk. When neither on_field_end nor on_array_item_end is
+    needed, no context is kept; otherwise only the text inside arrays is.
+    Assigning a new handler works these out again; do it between documents.
+    """
 
+    def __init__(self, handler: JSONParserHandler = None, chunk_size: Optional[int] = 1):
         # Core state - initialize RootState with self reference
         self._state: ParserState = None
         self._previous_state: ParserState = None
+        self._shared_states: Tuple[ParserState, ...] = ()
+
+        # Callbacks registered for single (path, field_name) pairs
+        self._field_end_rules: Dict[Tuple[str, str], Callable[[str, Any], None]] = {}
+
+        # Sets the callback flags and bound callbacks
+        self.handler = handler or JSONParserHandler()
+
+        # Batching of on_value_chunk callbacks
+        self.chunk_size = chunk_size
+        self._pending_chunks: List[str] = []
+        self._pending_length: int = 0
+        self._pending_key: Tuple[str, str] = ('', '')
+
+        # Decoder for bytes input; keeps incomplete UTF-8 sequences between deltas
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+
+        # Length of the text already parsed by parse_append
+        self._consumed_length: int = 0
 
         # Parsing buffers
         self.buffers = Buffers()
@@ -32,19 +90,80 @@ class StreamingJSONParser:
         # All tracking state (brackets, paths, context, extractor)
         self.tracker = Tracker()
 
-        # Initialize state after parser is fully constructed
-        self._state = RootState(self)
+        # Initialize states after parser is fully constructed. States that
+        # keep nothing between visits are created once and reused on every
+        # transition; string values and unicode escapes get a fresh state.
+        self._root_state = RootState(self)
+        self._field_name_state = FieldNameState(self)
+        self._after_field_name_state = AfterFieldNameState(self)
+        self._after_colon_state = AfterColonState(self)
+        self._primitive_state = PrimitiveState(self)
+        self._in_object_wait_state = InObjectWaitState(self)
+        self._in_array_wait_state = InArrayWaitState(self)
+        self._escape_state = EscapeState(self)
+        self._shared_states = (
+            self._root_state,
+            self._field_name_state,
+            self._after_field_name_state,
+            self._after_colon_state,
+            self._primitive_state,
+            self._in_object_wait_state,
+            self._in_array_wait_state,
+            self._escape_state,
+        )
+        self._state = self._root_state
+
+    def reset(self) -> None:
+        """
+        Prepare the parser for a new document.
+
+        Unfinished input and undelivered value chunks are dropped. The
+        handler and the parser's buffers are kept, so reusing one parser
+        for many small documents avoids setting it up again each time.
+        """
+        self._pending_chunks = []
+        self._pending_length = 0
+        self._pending_key = ('', '')
+        self._utf8_decoder.reset()
+        self._consumed_length = 0
+        self.buffers.clear_all()
+        self.tracker.reset()
+        self._previous_state = None
+        self._state = self._root_state
+
+    @property
+    def handler(self) -> JSONParserHandler:
+        """Handler receiving the parsing events."""
+        return self._handler
+
+    @handler.setter
+    def handler(self, handler: JSONParserHandler) -> None:
+        self._handler = handler
+
+        # Which callbacks the handler actually implements
+        self._emit_field_start = _overrides(handler, 'on_field_start')
+        self._emit_value_chunks = _overrides(handler, 'on_value_chunk')
+        self._emit_array_item_start = _overrides(handler, 'on_array_item_start')
+        self._emit_array_item_end = _overrides(handler, 'on_array_item_end')
+        self._emit_field_end = _overrides(handler, 'on_field_end') or bool(self._field_end_rules)
+
+        # Bound once instead of looked up on the handler per call
+        self._on_value_chunk = handler.on_value_chunk
+        self._on_field_end = handler.on_field_end
+
+        # The context is only read to extract array items and array values
+        self._need_context = self._emit_array_item_end or self._emit_field_end
+
+        for state in self._shared_states:
+            state.handler = handler
+        if self._state is not None:
+            self._state.handler = handler
 
     @property
     def state(self) -> ParserState:
         """Current parser state object."""
         return self._state
 
-    @property
-    def _extractor(self):
-        """Get the JSON extractor from tracker."""
-        return self.tracker.extractor
-
     # ========================================================================
     # CORE PARSING METHODS
     # ========================================================================
@@ -54,14 +173,127 @@ class StreamingJSONParser:
         self._previous_state = self._state
         self._state = new_state
 
-    def parse_incremental(self, delta: str) -> None:
-        """Parse new characters incrementally."""
+    def register(self, path: str, field_name: str, callback: Callable[[str, Any], None]) -> None:
+        """
+        Call callback(value, parsed_value) when the field ends at path.
+
+        This is looked up in a dict per field end instead of comparing
+        path and field_name in on_field_end. Register before parsing: the
+        values of arrays that are already open cannot be extracted.
+        """
+        self._field_end_rules[(path, field_name)] = callback
+        self._emit_field_end = True
+        self._need_context = True
+
+    def emit_field_end(
+        self, path: str, field_name: str, value: str, parsed_value: Any = None
+    ) -> None:
+        """Send a finished field value to the handler and to its registered callback."""
+        self._on_field_end(path, field_name, value, parsed_value=parsed_value)
+        if self._field_end_rules:
+            callback = self._field_end_rules.get((path, field_name))
+            if callback is not None:
+                callback(value, parsed_value)
+
+    def emit_value_chunk(self, path: str, field_name: str, chunk: str) -> None:
+        """
+        Send streamed value text to the handler, batching if configured.
+
+        The text may hold several characters; it is delivered one character
+        per callback, or in pieces of chunk_size characters when batching.
+        """
+        if not self._emit_value_chunks:
+            return
+
+        on_value_chunk = self._on_value_chunk
+        size = self.chunk_size
+        if size is not None and size <= 1:
+            if len(chunk) == 1:
+                on_value_chunk(path, field_name, chunk)
+            else:
+                # One call per character, with the loop driven from C
+                deque(map(on_value_chunk, repeat(path), repeat(field_name), chunk), 0)
+            return
+
+        self._pending_chunks.append(chunk)
+        self._pending_length += len(chunk)
+        self._pending_key = (path, field_name)
+        if size is None or self._pending_length < size:
+            return
+
+        # Deliver every full chunk and keep the remainder pending
+        text = "".join(self._pending_chunks)
+        full = len(text) - len(text) % size
+        for start in range(0, full, size):
+            on_value_chunk(path, field_name, text[start:start + size])
+        rest = text[full:]
+        self._pending_chunks = [rest] if rest else []
+        self._pending_length = len(rest)
+
+    def flush_value_chunks(self) -> None:
+        """Deliver any batched value chunks to the handler."""
+        if not self._pending_chunks:
+            return
+
+        path, field_name = self._pending_key
+        chunk = "".join(self._pending_chunks)
+        self._pending_chunks = []
+        self._pending_length = 0
+        self._on_value_chunk(path, field_name, chunk)
+
+    def parse_incremental(self, delta: Union[str, bytes, bytearray, memoryview]) -> None:
+        """
+        Parse new characters incrementally.
+
+        delta may also be UTF-8 encoded bytes, or a bytearray or memoryview
+        such as a reused receive buffer, which is decoded without copying it
+        to bytes first; a multi-byte character split across two deltas is
+        parsed once its last byte arrives.
+        """
+        if isinstance(delta, _BYTES_TYPES):
+            delta = self._utf8_decoder.decode(delta)
         if not delta:
             return
 
-        for char in delta:
-            self.tracker.append_to_context(char)
-            self._state.handle(char)
+        # Bound once; the loop below runs per run and per structural character
+        tracker = self.tracker
+        append_to_context = tracker.append_to_context if self._need_context else None
+        pos = 0
+        end = len(delta)
+
+        while pos < end:
+            state = self._state
+
+            # Hand plain runs (string contents, whitespace, primitive
+            # characters) to the state in one call
+            run_end = state.run_end
+            if run_end is not None:
+                match = run_end.search(delta, pos)
+                stop = match.start() if match is not None else end
+                run_limit = state.run_limit
+                if run_limit is not None and stop > pos + run_limit:
+                    stop = pos + run_limit
+                if stop > pos:
+                    run = delta[pos:stop]
+                    if append_to_context is not None and tracker.open_arrays:
+                        append_to_context(run)
+                    state.handle_run(run)
+                    pos = stop
+                    if pos == end:
+                        break
+                    state = self._state
+
+            # Values are only extracted inside arrays, so text outside them
+            # is not kept; the [ opening an array is its recorded start
+            char = delta[pos]
+            if append_to_context is not None and (tracker.open_arrays or char == '['):
+                append_to_context(char)
+            state.handle(char)
+            pos += 1
+
+        # Whole-string delivery waits for the closing quote instead
+        if self.chunk_size is not None:
+            self.flush_value_chunks()
 
     def parse_from_old_new(self, old_text: str, new_text: str) -> None:
         """Convenience method to parse delta between old and new text."""
@@ -69,3 +301,17 @@ class StreamingJSONParser:
             raise ValueError("new_text must start with old_text")
         delta = new_text[len(old_text):]
         self.parse_incremental(delta)
+
+    def parse_append(self, text: str) -> None:
+        """
+        Parse the part of text not seen by earlier parse_append calls.
+
+        text is the whole document received so far. Only the length parsed
+        so far is remembered, so unlike parse_from_old_new the text already
+        parsed is neither kept nor compared again on every call.
+        """
+        if len(text) < self._consumed_length:
+            raise ValueError("text must not be shorter than the text already parsed")
+        delta = text[self._consumed_length:]
+        self._consumed_length = len(text)
+        self.parse_incremental(delta)
@@ -0,0 +1,156 @@
+"""
+Scanner - Character scans over the context string.
+
+These functions locate the boundaries of JSON values inside the context
+buffer. They are kept at module level, free of parser state, so the
+extractor stays a thin layer over them. Each scan jumps between candidate
+positions with str.find/str.rfind or walks the structural tokens found by
+a compiled regex, which run in C, instead of looping over every character
+in Python.
+"""
+
+import re
+
+
+# Structural tokens: brackets, quotes and escape sequences. An escape is
+# matched together with the character it escapes, so quotes and brackets
+# inside strings can be told apart while walking the matches in order. A
+# trailing backslash whose escaped character has not arrived yet matches alone.
+STRUCTURAL = re.compile(r'\\.?|[{}\[\]"]', re.DOTALL)
+
+# The rest of a string after its opening quote, up to and including the
+# closing quote; escaped characters are skipped
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+# First character ending a run the parser can consume in bulk: inside a
+# string, while skipping whitespace, inside a primitive value, and in the
+# digits of a unicode escape
+STRING_RUN_END = re.compile(r'["\\]')
+WHITESPACE_RUN_END = re.compile(r'[^ \t\n\r]')
+PRIMITIVE_RUN_END = re.compile(r'[,}\] \t\n\r]')
+HEX_RUN_END = re.compile(r'[^0-9a-fA-F]')
+
+# A run of primitive characters (number, true, false, null) ending the input
+_PRIMITIVE_TAIL = re.compile(r'[^,:\[ \t\n\r]*\Z')
+
+# Characters looked at first when finding where a primitive starts
+_PRIMITIVE_WINDOW = 32
+
+# Characters looked at first when skipping characters backwards
+_SKIP_WINDOW = 32
+
+
+def find_opening(s: str, end: int, open_ch: str, close_ch: str) -> int:
+    """
+    Find the opener matching the last closer before end.
+
+    Scans s[:end] backwards, counting close_ch/open_ch pairs. Strings are
+    not taken into account. Returns -1 if no matching opener is found.
+    """
+    bracket_count = 0
+    close_pos = s.rfind(close_ch, 0, end)
+    open_pos = s.rfind(open_ch, 0, end)
+    while open_pos >= 0:
+        if close_pos > open_pos:
+            bracket_count += 1
+            close_pos = s.rfind(close_ch, 0, close_pos)
+        else:
+            bracket_count -= 1
+            if bracket_count == 0:
+                return open_pos
+            open_pos = s.rfind(open_ch, 0, open_pos)
+    return -1
+
+
+def find_array_end(s: str, start: int) -> int:
+    """
+    Find the position just past the bracket closing the array at start.
+
+    Strings are skipped whole, so brackets inside them are ignored, and
+    escaped characters are skipped. Returns len(s) if the array is not
+    closed yet.
+    """
+    bracket_count = 0
+    pos = start
+
+    while True:
+        match = STRUCTURAL.search(s, pos)
+        if match is None:
+            return len(s)
+        ch = match.group()
+        pos = match.end()
+        if ch == '"':
+            match = _STRING_REST.match(s, pos)
+            if match is None:
+                return len(s)
+            pos = match.end()
+        elif ch == '[':
+            bracket_count += 1
+        elif ch == ']':
+            bracket_count -= 1
+            if bracket_count == 0:
+                return pos
+
+
+def find_string_start(s: str, end: int) -> int:
+    """
+    Find the opening quote of the string whose closing quote is at end.
+
+    A quote is skipped if it follows an odd number of backslashes.
+    Returns -1 if no opening quote is found.
+    """
+    quote_pos = s.rfind('"', 0, end)
+    while quote_pos >= 0:
+        i = quote_pos - 1
+        while i >= 0 and s[i] == '\\':
+            i -= 1
+        if (quote_pos - 1 - i) % 2 == 0:
+            return quote_pos
+        quote_pos = s.rfind('"', 0, quote_pos)
+    return -1
+
+
+def find_primitive_start(s: str, end: int) -> int:
+    """
+    Find where the primitive value ending just before end starts.
+
+    The value starts after the last ',', ':', '[' or whitespace before end,
+    or at 0 if there is none. The regex only looks at a short window before
+    end, which is widened if the value fills it.
+    """
+    window = _PRIMITIVE_WINDOW
+    while True:
+        start = max(end - window, 0)
+        match = _PRIMITIVE_TAIL.search(s, start, end)
+        if match.start() > start or start == 0:
+            return match.start()
+        window *= 4
+
+
+def find_last_non_whitespace(s: str, end: int) -> int:
+    """
+    Find the last character before end that is not JSON whitespace.
+
+    Returns -1 if there is only whitespace before end.
+    """
+    return find_last_not_in(s, end, ' \t\n\r')
+
+
+def find_last_not_in(s: str, end: int, chars: str) -> int:
+    """
+    Find the last character before end that is not one of chars.
+
+    A short window before end is stripped at a time, widening it while it
+    holds only chars, so the context is not copied. Returns -1 if every
+    character before end is one of chars.
+    """
+    window = _SKIP_WINDOW
+    while True:
+        start = max(end - window, 0)
+        stripped = s[start:end].rstrip(chars)
+        if stripped:
+            return start + len(stripped) - 1
+        if start == 0:
+            return -1
+        end = start
+        window *= 4
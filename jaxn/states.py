@@ -5,79 +5,129 @@ This provides a clean, object-oriented state machine pattern for JSON parsing.
 """
 
 import json as json_module
-from typing import TYPE_CHECKING
+import sys
+from re import Pattern
+from typing import TYPE_CHECKING, Optional
+
+from .scanner import (
+    HEX_RUN_END,
+    PRIMITIVE_RUN_END,
+    STRING_RUN_END,
+    WHITESPACE_RUN_END,
+    find_last_non_whitespace,
+)
 
 if TYPE_CHECKING:
     from .parser import StreamingJSONParser
 
 
+# Character classes tested by the states
+_WHITESPACE = frozenset(' \t\n\r')
+_CLOSERS = frozenset('}]')
+_PRIMITIVE_START = frozenset('0123456789tfn-')
+_PRIMITIVE_END = frozenset(',}] \t\n\r')
+# Literal primitives, decoded without json.loads
+_LITERALS = {'true': True, 'false': False, 'null': None}
+# The decoder's scanners (the C ones when available), called directly to
+# decode one value without the json.loads wrapper
+_scan_once = json_module.JSONDecoder().scan_once
+_scanstring = json_module.decoder.scanstring
+# Raised while decoding text that is not a valid value, including
+# integers over the digit limit and nesting deeper than the recursion limit
+_DECODE_ERRORS = (StopIteration, ValueError, RecursionError)
+
+
 # ========================================================================
 # SHARED HELPER FUNCTIONS
 # ========================================================================
 
+def parse_primitive(raw: str):
+    """
+    Decode a primitive value, falling back to the raw text if it is invalid.
+
+    raw is expected to be stripped of surrounding whitespace.
+    """
+    if raw in _LITERALS:
+        return _LITERALS[raw]
+    try:
+        # Plain integers (no sign, no leading zero) are the common number form
+        if raw.isdigit() and raw.isascii() and (raw[0] != '0' or len(raw) == 1):
+            return int(raw)
+        value, end = _scan_once(raw, 0)
+    except _DECODE_ERRORS:
+        return raw
+    return value if end == len(raw) else raw
+
+
 def handle_close_brace(tracker, extractor, handler, parser) -> None:
     """Handle closing } brace - used by multiple states."""
 
-    if tracker.is_object_in_array() and len(tracker.path_stack) >= 2:
-        # Object is inside an array - get array field from path_stack
-        array_field = tracker.path_stack[-2][0]
-        path = tracker.get_path(-2)
-        obj = extractor.extract_last_object()
-        if obj:
-            handler.on_array_item_end(path, array_field, item=obj)
+    if tracker.is_object_in_array() and tracker.object_starts:
+        start_pos = tracker.object_starts.pop() - tracker.offset
+        if (parser._emit_array_item_end and start_pos >= 0 and
+                len(tracker.path_stack) >= 2):
+            # Object is inside an array - get array field from path_stack
+            array_field = tracker.path_stack[-2][0]
+            path = tracker.get_path(-2)
+            obj = extractor.extract_object_at_position(start_pos)
+            if obj:
+                handler.on_array_item_end(path, array_field, item=obj)
 
-    tracker.bracket_stack.pop()
+    tracker.pop_bracket()
 
     if tracker.at_object_level():
-        tracker.path_stack.pop()
+        tracker.pop_path()
 
     if tracker.has_brackets():
         if tracker.in_array():
-            parser._transition(InArrayWaitState(parser))
+            parser._transition(parser._in_array_wait_state)
         else:
-            parser._transition(InObjectWaitState(parser))
+            parser._transition(parser._in_object_wait_state)
     else:
-        parser._transition(RootState(parser))
+        parser._transition(parser._root_state)
 
 
 def handle_close_bracket(tracker, extractor, handler, parser) -> None:
     """Handle closing ] bracket - used by multiple states."""
 
-    if (len(tracker.bracket_stack) >= 2 and
+    if (parser._emit_array_item_end and
+        len(tracker.bracket_stack) >= 2 and
         tracker.at_array_level()):
 
-        pos = len(tracker) - 2
-        if pos >= 0:
-            while pos >= 0 and tracker[pos] in ' \t\n\r':
-                pos -= 1
-            if pos >= 0 and tracker[pos] not in '}]':
-                array_field = tracker.path_stack[-1][0]
-                path = tracker.get_path(-1)
-                item = extractor.extract_last_array_item()
-                if item is not None:
-                    handler.on_array_item_end(path, array_field, item=item)
+        # Look at the last non-whitespace character before the ]
+        s = tracker.content
+        pos = find_last_non_whitespace(s, len(s) - 1)
+        if pos >= 0 and s[pos] not in _CLOSERS:
+            array_field = tracker.path_stack[-1][0]
+            path = tracker.get_path(-1)
+            item = extractor.extract_last_array_item()
+            if item is not None:
+                handler.on_array_item_end(path, array_field, item=item)
 
     if tracker.at_array_level():
         field_name = tracker.path_stack[-1][0]
         path = tracker.get_path(-1)
-        key = (path, field_name)
-        start_pos = tracker.array_starts.get(key, 0)
-        arr = extractor.extract_array_at_position(start_pos)
-        arr_str = extractor.extract_array_string_at_position(start_pos)
-        handler.on_field_end(path, field_name, arr_str, parsed_value=arr)
-        if key in tracker.array_starts:
-            del tracker.array_starts[key]
-        tracker.path_stack.pop()
-
-    tracker.bracket_stack.pop()
+        start = tracker.array_starts.pop()
+        if parser._emit_field_end:
+            # Starts are absolute; one trimmed out of the context is unusable
+            if start >= tracker.offset:
+                # The closing bracket is the last character in the context
+                arr_str, arr = extractor.extract_array_and_string_at_position(
+                    start - tracker.offset, tracker.length)
+            else:
+                arr_str, arr = extractor.extract_array_and_string_at_position(0)
+            parser.emit_field_end(path, field_name, arr_str, parsed_value=arr)
+        tracker.pop_path()
+
+    tracker.pop_bracket()
 
     if tracker.has_brackets():
         if tracker.in_array():
-            parser._transition(InArrayWaitState(parser))
+            parser._transition(parser._in_array_wait_state)
         else:
-            parser._transition(InObjectWaitState(parser))
+            parser._transition(parser._in_object_wait_state)
     else:
-        parser._transition(RootState(parser))
+        parser._transition(parser._root_state)
 
 
 def check_primitive_array_item_end(tracker, extractor, handler, last_char: str) -> None:
@@ -86,7 +136,7 @@ def check_primitive_array_item_end(tracker, extractor, handler, last_char: str)
         return
     if not tracker.at_array_level():
         return
-    if last_char in '}]':
+    if last_char in _CLOSERS:
         return
 
     array_field = tracker.path_stack[-1][0]
@@ -103,21 +153,16 @@ def check_primitive_array_item_end_on_seperator(tracker, extractor, handler) ->
     if not tracker.at_array_level():
         return
 
-    # Look at the character before the comma/]
-    pos = len(tracker) - 2
+    # Look at the last non-whitespace character before the comma/]
+    s = tracker.content
+    pos = find_last_non_whitespace(s, len(s) - 1)
     if pos < 0:
         return
 
-    # Skip whitespace
-    while pos >= 0 and tracker[pos] in ' \t\n\r':
-        pos -= 1
-    if pos < 0:
-        return
-
-    last_char = tracker[pos]
+    last_char = s[pos]
 
     # Don't fire for objects (}) or nested arrays (])
-    if last_char in '}]':
+    if last_char in _CLOSERS:
         return
 
     array_field = tracker.path_stack[-1][0]
@@ -132,7 +177,23 @@ def check_primitive_array_item_end_on_seperator(tracker, extractor, handler) ->
 # ========================================================================
 
 class ParserState:
-    """Base class for parser states."""
+    """
+    Base class for parser states.
+
+    A state may set run_end to a regex matching the first character it
+    must see individually. The parser then hands it the characters before
+    that match in one handle_run() call instead of one handle() per char.
+    A state that only takes a fixed number of characters in bulk also sets
+    run_limit to cap the length of a run.
+
+    States use __slots__; a subclass lists the attributes it adds, or an
+    empty tuple if it adds none.
+    """
+
+    __slots__ = ('parser', 'tracker', 'handler', 'buffers')
+
+    run_end: Optional[Pattern] = None
+    run_limit: Optional[int] = None
 
     def __init__(self, parser: 'StreamingJSONParser'):
         self.parser = parser
@@ -144,6 +205,11 @@ class ParserState:
         """Handle a character. Subclasses must implement."""
         raise NotImplementedError
 
+    def handle_run(self, run: str) -> None:
+        """Handle a run of characters that contains no run_end match."""
+        for char in run:
+            self.handle(char)
+
 
 # ========================================================================
 # CONCRETE STATE CLASSES
@@ -152,9 +218,14 @@ class ParserState:
 class RootState(ParserState):
     """Initial state or between top-level values."""
 
+    __slots__ = ()
+
+    run_end = WHITESPACE_RUN_END
+
+    def handle_run(self, run: str) -> None:
+        pass  # Whitespace between tokens
+
     def handle(self, char: str) -> None:
-        if char in ' \t\n\r':
-            return
         if char == '{':
             self._handle_open_brace()
         elif char == '[':
@@ -162,16 +233,20 @@ class RootState(ParserState):
 
     def _handle_open_brace(self) -> None:
         self.tracker.bracket_stack.append('{')
-        self.parser._transition(InObjectWaitState(self.parser))
+        self.parser._transition(self.parser._in_object_wait_state)
 
     def _handle_open_bracket(self) -> None:
-        self.tracker.bracket_stack.append('[')
-        self.parser._transition(InArrayWaitState(self.parser))
+        self.tracker.push_bracket('[')
+        self.parser._transition(self.parser._in_array_wait_state)
 
 
 class FieldNameState(ParserState):
     """Parsing a field name (before colon)."""
 
+    __slots__ = ()
+
+    run_end = STRING_RUN_END
+
     def handle(self, char: str) -> None:
         if char == '\\':
             self._handle_escape()
@@ -180,77 +255,114 @@ class FieldNameState(ParserState):
         else:
             self.buffers.append_to_buffer(char)
 
+    def handle_run(self, run: str) -> None:
+        self.buffers.append_to_buffer(run)
+
     def _handle_escape(self) -> None:
-        self.parser._transition(EscapeState(self.parser))
+        self.parser._transition(self.parser._escape_state)
 
     def _handle_end_quote(self) -> None:
-        # The buffer now contains decoded characters (escape sequences processed)
-        self.tracker.field_name = self.buffers.buffer
+        # The buffer now contains decoded characters (escape sequences processed).
+        # Field names repeat across objects, so intern them for cheap comparisons.
+        self.tracker.field_name = sys.intern(self.buffers.buffer)
         self.buffers.clear_buffer()
-        self.parser._transition(AfterFieldNameState(self.parser))
+        self.parser._transition(self.parser._after_field_name_state)
 
 
 class AfterFieldNameState(ParserState):
     """Just finished field name, expecting colon."""
 
+    __slots__ = ()
+
+    run_end = WHITESPACE_RUN_END
+
+    def handle_run(self, run: str) -> None:
+        pass  # Whitespace between tokens
+
     def handle(self, char: str) -> None:
         if char == ':':
             self._handle_colon()
-        elif char not in ' \t\n\r':
+        elif char not in _WHITESPACE:
             pass  # Invalid JSON, ignore
 
     def _handle_colon(self) -> None:
-        self.parser._transition(AfterColonState(self.parser))
+        self.parser._transition(self.parser._after_colon_state)
 
 
 class AfterColonState(ParserState):
     """Just saw colon, expecting value."""
 
+    __slots__ = ()
+
+    run_end = WHITESPACE_RUN_END
+
+    def handle_run(self, run: str) -> None:
+        pass  # Whitespace between tokens
+
     def handle(self, char: str) -> None:
-        if char in ' \t\n\r':
-            return
-        if char == '"':
-            self._handle_string_start()
-        elif char == '{':
-            self._handle_object_start()
-        elif char == '[':
-            self._handle_array_start()
-        elif char.isdigit() or char in 'tfn-':
+        action = self._ACTIONS.get(char)
+        if action is not None:
+            action(self)
+        elif char in _PRIMITIVE_START or char.isdigit():
             self._handle_primitive_start(char)
 
     def _handle_string_start(self) -> None:
-        self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
+        if self.parser._emit_field_start:
+            self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
         self.buffers.clear_buffer()
         self.parser._transition(ValueStringState(self.parser))
 
     def _handle_object_start(self) -> None:
-        self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
-        self.tracker.path_stack.append((self.tracker.field_name, '{', len(self.tracker.bracket_stack)))
+        if self.parser._emit_field_start:
+            self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
+        self.tracker.push_path(self.tracker.field_name, '{')
         self.tracker.bracket_stack.append('{')
         self.tracker.field_name = ""
-        self.parser._transition(InObjectWaitState(self.parser))
+        self.parser._transition(self.parser._in_object_wait_state)
 
     def _handle_array_start(self) -> None:
         path = self.tracker.get_path()
-        self.handler.on_field_start(path, self.tracker.field_name)
-
-        key = (path, self.tracker.field_name)
-        self.tracker.array_starts[key] = len(self.tracker) - 1
+        if self.parser._emit_field_start:
+            self.handler.on_field_start(path, self.tracker.field_name)
 
-        self.tracker.path_stack.append((self.tracker.field_name, '[', len(self.tracker.bracket_stack)))
-        self.tracker.bracket_stack.append('[')
+        self.tracker.array_starts.append(self.tracker.offset + self.tracker.length - 1)
+        self.tracker.push_path(self.tracker.field_name, '[')
+        self.tracker.push_bracket('[')
         self.tracker.field_name = ""
-        self.parser._transition(InArrayWaitState(self.parser))
+        self.parser._transition(self.parser._in_array_wait_state)
 
     def _handle_primitive_start(self, char: str) -> None:
-        self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
+        if self.parser._emit_field_start:
+            self.handler.on_field_start(self.tracker.get_path(), self.tracker.field_name)
         self.buffers.buffer = char
-        self.parser._transition(PrimitiveState(self.parser))
+        self.parser._transition(self.parser._primitive_state)
+
+    # One lookup per character instead of an if/elif chain
+    _ACTIONS = {
+        '"': _handle_string_start,
+        '{': _handle_object_start,
+        '[': _handle_array_start,
+    }
 
 
 class ValueStringState(ParserState):
     """Inside a string value."""
 
+    __slots__ = ('path', 'field_name', 'had_escape', 'pending_surrogate')
+
+    run_end = STRING_RUN_END
+
+    def __init__(self, parser: 'StreamingJSONParser'):
+        super().__init__(parser)
+        # Where the streamed chunks belong; fixed until the string ends, and
+        # kept across escapes, which return to this same state object
+        self.path = self.tracker.get_path()
+        self.field_name = self.tracker.get_current_field_name()
+        # Whether the raw value holds an escape json.loads has to decode
+        self.had_escape = False
+        # A decoded high surrogate not streamed yet, in case a low one follows
+        self.pending_surrogate = ""
+
     def handle(self, char: str) -> None:
         if char == '\\':
             self._handle_escape()
@@ -259,73 +371,102 @@ class ValueStringState(ParserState):
         else:
             self._handle_regular_char(char)
 
+    def handle_run(self, run: str) -> None:
+        self._handle_regular_char(run)
+
     def _handle_escape(self) -> None:
-        self.parser._transition(EscapeState(self.parser))
+        self.had_escape = True
+        self.parser._transition(self.parser._escape_state)
 
     def _handle_end_quote(self) -> None:
-        raw = self.buffers.buffer
-
-        try:
-            parsed = json_module.loads('"' + raw + '"')
-        except:
-            parsed = raw
+        if self.pending_surrogate:
+            self.emit_chunk("")
+        self.parser.flush_value_chunks()
 
         # Only call on_field_end if we're NOT in an array
-        # Strings in arrays are items, not field values
+        # Strings in arrays are items, not field values, and are
+        # decoded from the context when the item ends
         if not self.tracker.in_array():
-            path = self.tracker.get_path()
-            field = self.tracker.field_name
-            self.handler.on_field_end(path, field, raw, parsed_value=parsed)
+            # The value is only decoded when something receives it
+            if self.parser._emit_field_end:
+                raw = self.buffers.buffer
+                # Without an escape there is nothing left to decode
+                if not self.had_escape:
+                    parsed = raw
+                else:
+                    try:
+                        # Scanned from just past an opening quote
+                        parsed, end = _scanstring(raw + '"', 0)
+                        if end != len(raw) + 1:
+                            parsed = raw
+                    except _DECODE_ERRORS:
+                        parsed = raw
+                path = self.tracker.get_path()
+                field = self.tracker.field_name
+                self.parser.emit_field_end(path, field, raw, parsed_value=parsed)
             self.tracker.field_name = ""
 
         self.buffers.clear_buffer()
 
         if self.tracker.in_array():
-            self.parser._transition(InArrayWaitState(self.parser))
+            self.parser._transition(self.parser._in_array_wait_state)
         else:
-            self.parser._transition(InObjectWaitState(self.parser))
+            self.parser._transition(self.parser._in_object_wait_state)
 
-    def _handle_regular_char(self, char: str) -> None:
-        self.buffers.append_to_buffer(char)
-        path = self.tracker.get_path()
-        field = self.tracker.get_current_field_name()
-        self.handler.on_value_chunk(path, field, char)
+    def _handle_regular_char(self, text: str) -> None:
+        self.buffers.append_to_buffer(text)
+        if self.parser._emit_value_chunks:
+            if self.pending_surrogate:
+                self.emit_chunk(text)
+            else:
+                self.parser.emit_value_chunk(self.path, self.field_name, text)
+
+    def emit_chunk(self, text: str) -> None:
+        """Stream decoded text of this value, after any held-back surrogate."""
+        if self.pending_surrogate:
+            text = self.pending_surrogate + text
+            self.pending_surrogate = ""
+        self.parser.emit_value_chunk(self.path, self.field_name, text)
 
 
 class PrimitiveState(ParserState):
     """Parsing a number, boolean, or null."""
 
+    __slots__ = ()
+
+    run_end = PRIMITIVE_RUN_END
+
     def handle(self, char: str) -> None:
-        if char in ',}]\t\n\r ':
+        if char in _PRIMITIVE_END:
             self._handle_value_end(char)
-        elif char == '"':
-            self.buffers.append_to_buffer(char)
         else:
             self.buffers.append_to_buffer(char)
 
+    def handle_run(self, run: str) -> None:
+        self.buffers.append_to_buffer(run)
+
     def _handle_value_end(self, char: str) -> None:
         raw = self.buffers.buffer.strip()
 
-        try:
-            parsed = json_module.loads(raw)
-        except:
-            parsed = raw
-
         # Only call on_field_end if we're NOT in an array
-        # Primitives in arrays are items, not field values
+        # Primitives in arrays are items, not field values, and are
+        # decoded from the context when the item ends
         if not self.tracker.in_array():
-            path = self.tracker.get_path()
-            field = self.tracker.field_name
-            self.handler.on_field_end(path, field, raw, parsed_value=parsed)
+            # The value is only decoded when something receives it
+            if self.parser._emit_field_end:
+                path = self.tracker.get_path()
+                field = self.tracker.field_name
+                parsed = parse_primitive(raw)
+                self.parser.emit_field_end(path, field, raw, parsed_value=parsed)
             self.tracker.field_name = ""
 
         self.buffers.clear_buffer()
 
         if char == ',':
-            if self.tracker.in_array() and raw:
+            if self.parser._emit_array_item_end and self.tracker.in_array() and raw:
                 check_primitive_array_item_end(
                     self.tracker,
-                    self.parser._extractor,
+                    self.tracker.extractor,
                     self.handler,
                     raw[-1]
                 )
@@ -333,81 +474,89 @@ class PrimitiveState(ParserState):
         elif char == '}':
             handle_close_brace(
                 self.tracker,
-                self.parser._extractor,
+                self.tracker.extractor,
                 self.handler,
                 self.parser
             )
         elif char == ']':
             handle_close_bracket(
                 self.tracker,
-                self.parser._extractor,
+                self.tracker.extractor,
                 self.handler,
                 self.parser
             )
 
     def _transition_to_wait_state(self) -> None:
         if self.tracker.in_array():
-            self.parser._transition(InArrayWaitState(self.parser))
+            self.parser._transition(self.parser._in_array_wait_state)
         else:
-            self.parser._transition(InObjectWaitState(self.parser))
+            self.parser._transition(self.parser._in_object_wait_state)
 
 
 class InObjectWaitState(ParserState):
     """Inside an object, waiting for field name or end."""
 
+    __slots__ = ()
+
+    run_end = WHITESPACE_RUN_END
+
+    def handle_run(self, run: str) -> None:
+        pass  # Whitespace between tokens
+
     def handle(self, char: str) -> None:
-        if char in ' \t\n\r':
-            return
-        if char == '"':
-            self._handle_field_start()
-        elif char == '}':
-            self._handle_close_brace()
-        elif char == ',':
-            pass  # Ready for next field
+        # A comma needs nothing: the next field name follows
+        action = self._ACTIONS.get(char)
+        if action is not None:
+            action(self)
 
     def _handle_field_start(self) -> None:
         self.buffers.clear_buffer()
-        self.parser._transition(FieldNameState(self.parser))
+        self.parser._transition(self.parser._field_name_state)
 
     def _handle_close_brace(self) -> None:
         handle_close_brace(
             self.tracker,
-            self.parser._extractor,
+            self.tracker.extractor,
             self.handler,
             self.parser
         )
 
+    _ACTIONS = {
+        '"': _handle_field_start,
+        '}': _handle_close_brace,
+    }
+
 
 class InArrayWaitState(ParserState):
     """Inside an array, waiting for value or end."""
 
+    __slots__ = ()
+
+    run_end = WHITESPACE_RUN_END
+
+    def handle_run(self, run: str) -> None:
+        pass  # Whitespace between tokens
+
     def handle(self, char: str) -> None:
-        if char in ' \t\n\r':
-            return
-        if char == ',':
-            self._handle_comma()
-        elif char == ']':
-            self._handle_close_bracket()
-        elif char == '"':
-            self._handle_string_start()
-        elif char == '{':
-            self._handle_object_start()
-        elif char == '[':
-            self._handle_array_start()
-        elif char.isdigit() or char in 'tfn-':
+        action = self._ACTIONS.get(char)
+        if action is not None:
+            action(self)
+        elif char in _PRIMITIVE_START or char.isdigit():
             self._handle_primitive_start(char)
 
     def _handle_comma(self) -> None:
+        if not self.parser._emit_array_item_end:
+            return
         check_primitive_array_item_end_on_seperator(
             self.tracker,
-            self.parser._extractor,
+            self.tracker.extractor,
             self.handler
         )
 
     def _handle_close_bracket(self) -> None:
         handle_close_bracket(
             self.tracker,
-            self.parser._extractor,
+            self.tracker.extractor,
             self.handler,
             self.parser
         )
@@ -417,63 +566,72 @@ class InArrayWaitState(ParserState):
         self.parser._transition(ValueStringState(self.parser))
 
     def _handle_object_start(self) -> None:
-        if self.tracker.at_array_level():
+        if self.parser._emit_array_item_start and self.tracker.at_array_level():
             array_field = self.tracker.path_stack[-1][0]
             path = self.tracker.get_path(-1)
             self.handler.on_array_item_start(path, array_field)
 
+        self.tracker.object_starts.append(self.tracker.offset + self.tracker.length - 1)
         self.tracker.bracket_stack.append('{')
-        self.tracker.path_stack.append(('', '{', len(self.tracker.bracket_stack) - 1))
-        self.parser._transition(InObjectWaitState(self.parser))
+        self.tracker.push_path('', '{')
+        self.parser._transition(self.parser._in_object_wait_state)
 
     def _handle_array_start(self) -> None:
-        self.tracker.bracket_stack.append('[')
-        self.tracker.path_stack.append(('', '[', len(self.tracker.bracket_stack) - 1))
-        self.parser._transition(InArrayWaitState(self.parser))
+        self.tracker.array_starts.append(self.tracker.offset + self.tracker.length - 1)
+        self.tracker.push_bracket('[')
+        self.tracker.push_path('', '[')
+        self.parser._transition(self.parser._in_array_wait_state)
 
     def _handle_primitive_start(self, char: str) -> None:
-        if self.tracker.at_array_level():
+        if self.parser._emit_field_start and self.tracker.at_array_level():
             array_field = self.tracker.path_stack[-1][0]
             path = self.tracker.get_path(-1)
             self.handler.on_field_start(path, array_field)
         self.buffers.buffer = char
-        self.parser._transition(PrimitiveState(self.parser))
+        self.parser._transition(self.parser._primitive_state)
+
+    # One lookup per character instead of an if/elif chain
+    _ACTIONS = {
+        ',': _handle_comma,
+        ']': _handle_close_bracket,
+        '"': _handle_string_start,
+        '{': _handle_object_start,
+        '[': _handle_array_start,
+    }
 
 
 class EscapeState(ParserState):
     """Processing escape sequence \\X."""
 
+    __slots__ = ()
+
     _ESCAPE_MAP = {
         'n': '\n', 't': '\t', 'r': '\r',
         '\\': '\\', '"': '"', '/': '/',
         'b': '\b', 'f': '\f',
     }
+    # The escape sequences as they appear in the raw value
+    _RAW_ESCAPES = {char: '\\' + char for char in _ESCAPE_MAP}
 
     def handle(self, char: str) -> None:
         if char == 'u':
             self._handle_unicode_escape()
             return
 
-        was_in_value = isinstance(self.parser._previous_state, ValueStringState)
-        was_in_field_name = isinstance(self.parser._previous_state, FieldNameState)
-
-        # Decode the escape sequence
-        decoded = self._ESCAPE_MAP.get(char, char)
+        previous_state = self.parser._previous_state
+        was_in_value = isinstance(previous_state, ValueStringState)
+        was_in_field_name = not was_in_value and isinstance(previous_state, FieldNameState)
 
-        if was_in_value:
-            # For value strings, add raw to buffer but also send decoded chunk
-            self.buffers.append_to_buffer('\\' + char)
-            path = self.tracker.get_path()
-            field = self.tracker.get_current_field_name()
-            self.handler.on_value_chunk(path, field, decoded)
-        elif was_in_field_name:
+        if was_in_field_name:
             # For field names, add decoded directly to buffer
-            self.buffers.append_to_buffer(decoded)
+            self.buffers.append_to_buffer(self._ESCAPE_MAP.get(char, char))
         else:
-            # Fallback - add raw escape
-            self.buffers.append_to_buffer('\\' + char)
+            # Add the raw escape; value strings also stream the decoded char
+            self.buffers.append_to_buffer(self._RAW_ESCAPES.get(char) or '\\' + char)
+            if was_in_value and self.parser._emit_value_chunks:
+                previous_state.emit_chunk(self._ESCAPE_MAP.get(char, char))
 
-        self._transition_back(was_in_value, was_in_field_name)
+        self._transition_back(previous_state, was_in_value, was_in_field_name)
 
     def _handle_unicode_escape(self) -> None:
         self.buffers.clear_unicode_buffer()
@@ -482,24 +640,42 @@ class EscapeState(ParserState):
         self.parser._unicode_escape_source = self.parser._previous_state
         self.parser._transition(UnicodeEscapeState(self.parser))
 
-    def _transition_back(self, was_in_value: bool, was_in_field_name: bool) -> None:
-        if was_in_value:
-            self.parser._transition(ValueStringState(self.parser))
-        elif was_in_field_name:
-            self.parser._transition(FieldNameState(self.parser))
+    def _transition_back(
+        self, previous_state: ParserState, was_in_value: bool, was_in_field_name: bool
+    ) -> None:
+        if was_in_value or was_in_field_name:
+            self.parser._transition(previous_state)
         else:
-            self.parser._transition(FieldNameState(self.parser))
+            self.parser._transition(self.parser._field_name_state)
 
 
 class UnicodeEscapeState(ParserState):
     """Processing unicode escape \\uXXXX."""
 
+    __slots__ = ('run_limit',)
+
+    run_end = HEX_RUN_END
+
+    def __init__(self, parser: 'StreamingJSONParser'):
+        super().__init__(parser)
+        # Hex digits arrive in one run unless the escape spans deltas
+        self.run_limit = 4 - self.buffers.unicode_length
+
     def handle(self, char: str) -> None:
         self.buffers.append_to_buffer(char)
         self.buffers.append_to_unicode_buffer(char)
+        self._after_digits()
 
-        if len(self.buffers.unicode_buffer) == 4:
+    def handle_run(self, run: str) -> None:
+        self.buffers.append_to_buffer(run)
+        self.buffers.append_hex_digits(run)
+        self._after_digits()
+
+    def _after_digits(self) -> None:
+        if self.buffers.unicode_length == 4:
             self._process_escape_sequence()
+        else:
+            self.run_limit = 4 - self.buffers.unicode_length
 
     def _process_escape_sequence(self) -> None:
         # Use the saved source state from when we entered EscapeState
@@ -507,45 +683,61 @@ class UnicodeEscapeState(ParserState):
         was_in_field_name = isinstance(source_state, FieldNameState)
         was_in_value = isinstance(source_state, ValueStringState)
 
-        try:
-            code_point = int(self.buffers.unicode_buffer, 16)
-            decoded = chr(code_point)
-        except:
-            decoded = None
+        code_point = self.buffers.unicode_value
 
-        if decoded is not None:
-            self._handle_valid_escape(decoded, was_in_value)
+        if code_point is not None:
+            self._handle_valid_escape(code_point, source_state if was_in_value else None)
         else:
-            self._handle_invalid_escape(was_in_value)
+            self._handle_invalid_escape(source_state if was_in_value else None)
 
         self.buffers.clear_unicode_buffer()
         # Clean up the saved state
         if hasattr(self.parser, '_unicode_escape_source'):
             delattr(self.parser, '_unicode_escape_source')
 
-        # Transition back to the appropriate state
-        if was_in_field_name:
-            self.parser._transition(FieldNameState(self.parser))
+        # Transition back to the state the escape started in
+        if was_in_field_name or was_in_value:
+            self.parser._transition(source_state)
         else:
             self.parser._transition(ValueStringState(self.parser))
 
-    def _handle_valid_escape(self, decoded: str, was_in_value: bool) -> None:
+    def _handle_valid_escape(
+        self, code_point: int, value_state: Optional[ValueStringState]
+    ) -> None:
         # Replace the \uXXXX in buffer with decoded character
-        current_buffer = self.buffers.buffer
-        self.buffers.buffer = current_buffer[:-6] + decoded
-
-        if was_in_value:
-            # For value strings, send decoded chunk to handler
-            path = self.tracker.get_path()
-            field = self.tracker.get_current_field_name()
-            self.handler.on_value_chunk(path, field, decoded)
+        replaced = 6
+        if 0xDC00 <= code_point <= 0xDFFF:
+            high = self.buffers.buffer_tail(7)[:-6]
+            if high and 0xD800 <= ord(high) <= 0xDBFF:
+                # Low half of a surrogate pair: both halves become one character
+                code_point = 0x10000 + ((ord(high) - 0xD800) << 10) + (code_point - 0xDC00)
+                replaced = 7
+        decoded = chr(code_point)
+        self.buffers.replace_buffer_tail(replaced, decoded)
+
+        if value_state is None or not self.parser._emit_value_chunks:
+            return
+        # For value strings, send decoded chunk to handler
+        if replaced == 7:
+            if not value_state.pending_surrogate:
+                # The high half was streamed already (it was not an escape)
+                decoded = chr(self.buffers.unicode_value)
+            # The held-back high half is part of decoded
+            value_state.pending_surrogate = ""
+        if 0xD800 <= code_point <= 0xDBFF:
+            if value_state.pending_surrogate:
+                value_state.emit_chunk("")
+            value_state.pending_surrogate = decoded
+        else:
+            value_state.emit_chunk(decoded)
 
-    def _handle_invalid_escape(self, was_in_value: bool) -> None:
-        if was_in_value:
+    def _handle_invalid_escape(self, value_state: Optional[ValueStringState]) -> None:
+        if value_state is not None and self.parser._emit_value_chunks:
             # For value strings, send individual characters to handler
-            path = self.tracker.get_path()
-            field = self.tracker.get_current_field_name()
-            self.handler.on_value_chunk(path, field, '\\')
-            self.handler.on_value_chunk(path, field, 'u')
-            for c in self.buffers.unicode_buffer:
-                self.handler.on_value_chunk(path, field, c)
+            path = value_state.path
+            field = value_state.field_name
+            value_state.emit_chunk('\\')
+            self.parser.emit_value_chunk(path, field, 'u')
+            # The raw hex characters are the last 4 in the main buffer
+            for c in self.buffers.buffer_tail(4):
+                self.parser.emit_value_chunk(path, field, c)
@@ -9,95 +9,126 @@ This class tracks:
 - Context buffer for value extraction
 """
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+import sys
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
-if TYPE_CHECKING:
-    from .extractor import JSONExtractor
-
-
-def _create_extractor(tracker):
-    """Create extractor lazily to avoid circular import."""
-    from .extractor import JSONExtractor
-    return JSONExtractor(tracker)
+from .extractor import JSONExtractor
 
 
 class Tracker:
     """
     Manages all parsing state including brackets, paths, fields, and context.
 
-    The bracket_stack tracks nesting of {} and [].
-    The path_stack tracks field names and types for building paths.
-    The context buffer stores characters for value extraction.
+    The bracket_stack tracks nesting of {} and []. open_arrays counts the
+    [ on it; the parser only appends to the context while an array is open.
+    The path_stack tracks field names and types for building paths. It is
+    changed through push_path/pop_path, which keep the path string of every
+    prefix of the stack, so get_path() is a list lookup.
+    The context buffer stores characters for value extraction. It is kept
+    as a window of chunks with a running length, so appending and trimming
+    are cheap; the string is only joined (and cached) when it is read.
+    The window is allowed to grow to twice max_size before it is compacted
+    back to max_size, so trimming happens once per max_size characters
+    instead of on every append.
     """
 
+    __slots__ = (
+        'bracket_stack', 'open_arrays', 'path_stack', '_paths', 'array_starts',
+        'object_starts', 'field_name',
+        '_chunks', '_head', 'length', 'offset', '_cached', '_max_size',
+        'extractor',
+    )
+
     def __init__(self, max_size: int = 50000):
-        # Bracket and path tracking
-        self._bracket_stack: List[str] = []
-        self._path_stack: List[Tuple[str, str, int]] = []
-        self._array_starts: Dict[Tuple[str, str], int] = {}
-        self._field_name: str = ""
+        # Bracket and path tracking (plain attributes for direct access)
+        self.bracket_stack: List[str] = []
+        # Number of [ in bracket_stack; values are only extracted inside arrays
+        self.open_arrays: int = 0
+        self.path_stack: List[Tuple[str, str]] = []
+        # _paths[i] is the path string for path_stack[:i]
+        self._paths: List[str] = ['']
+        # Absolute context positions of open arrays, one per '[' entry of
+        # path_stack, and of objects opened directly in arrays; trimming
+        # leaves them unchanged
+        self.array_starts: List[int] = []
+        self.object_starts: List[int] = []
+        self.field_name: str = ""
 
         # Context buffer for extraction
-        self._content: str = ""
+        self._chunks: Deque[str] = deque()
+        self._head: int = 0
+        # Plain attributes, read directly by the states: the number of
+        # characters in the context and the absolute stream position of
+        # its first character
+        self.length: int = 0
+        self.offset: int = 0
+        self._cached: Optional[str] = ""
         self._max_size = max_size
-        self._extractor = None
+        self.extractor = JSONExtractor(self)
+
+    def reset(self) -> None:
+        """Forget all tracking state and context, keeping the containers."""
+        self.bracket_stack.clear()
+        self.open_arrays = 0
+        self.path_stack.clear()
+        del self._paths[1:]
+        self.array_starts.clear()
+        self.object_starts.clear()
+        self.field_name = ""
+
+        self._chunks.clear()
+        self._head = 0
+        self.length = 0
+        self.offset = 0
+        self._cached = ""
 
     # ========================================================================
     # BRACKET AND PATH TRACKING
     # ========================================================================
 
-    @property
-    def bracket_stack(self) -> List[str]:
-        """Get the bracket stack (for direct access)."""
-        return self._bracket_stack
-
-    @property
-    def path_stack(self) -> List[Tuple[str, str, int]]:
-        """Get the path stack (for direct access)."""
-        return self._path_stack
-
-    @property
-    def array_starts(self) -> Dict[Tuple[str, str], int]:
-        """Get the array starts dictionary."""
-        return self._array_starts
-
-    @property
-    def field_name(self) -> str:
-        """Get the current field name being parsed."""
-        return self._field_name
-
-    @field_name.setter
-    def field_name(self, value: str) -> None:
-        """Set the current field name being parsed."""
-        self._field_name = value
-
     def push_bracket(self, bracket: str) -> None:
         """Push a bracket ({ or [) onto the stack."""
-        self._bracket_stack.append(bracket)
+        self.bracket_stack.append(bracket)
+        if bracket == '[':
+            self.open_arrays += 1
 
     def pop_bracket(self) -> str:
         """Pop and return the top bracket from the stack."""
-        return self._bracket_stack.pop()
+        bracket = self.bracket_stack.pop()
+        if bracket == '[':
+            self.open_arrays -= 1
+        return bracket
 
     def peek_bracket(self) -> str:
         """Return the top bracket without popping."""
-        return self._bracket_stack[-1] if self._bracket_stack else ''
-
-    def push_path(self, field_name: str, bracket_type: str, depth: int) -> None:
-        """Push a path entry onto the stack."""
-        self._path_stack.append((field_name, bracket_type, depth))
-
-    def pop_path(self) -> Tuple[str, str, int]:
+        return self.bracket_stack[-1] if self.bracket_stack else ''
+
+    def push_path(self, field_name: str, bracket_type: str) -> None:
+        """Push a (field_name, bracket_type) path entry onto the stack."""
+        self.path_stack.append((field_name, bracket_type))
+        parent = self._paths[-1]
+        if not field_name:
+            path = parent or '/'
+        elif parent == '' or parent == '/':
+            path = '/' + field_name
+        else:
+            path = parent + '/' + field_name
+        # Interned so a path repeated in every array item is one object
+        self._paths.append(sys.intern(path))
+
+    def pop_path(self) -> Tuple[str, str]:
         """Pop and return the top path entry from the stack."""
-        return self._path_stack.pop()
+        self._paths.pop()
+        return self.path_stack.pop()
 
     def in_array(self) -> bool:
         """Check if we're currently inside an array."""
-        return self._bracket_stack and self._bracket_stack[-1] == '['
+        return self.bracket_stack and self.bracket_stack[-1] == '['
 
     def in_object(self) -> bool:
         """Check if we're currently inside an object."""
-        return self._bracket_stack and self._bracket_stack[-1] == '{'
+        return self.bracket_stack and self.bracket_stack[-1] == '{'
 
     def at_array_level(self) -> bool:
         """
@@ -106,7 +137,7 @@ class Tracker:
         This is true when path_stack has entries and the top entry
         represents an array (bracket_type == '[').
         """
-        return self._path_stack and self._path_stack[-1][1] == '['
+        return self.path_stack and self.path_stack[-1][1] == '['
 
     def at_object_level(self) -> bool:
         """
@@ -115,11 +146,11 @@ class Tracker:
         This is true when path_stack has entries and the top entry
         represents an object (bracket_type == '{').
         """
-        return self._path_stack and self._path_stack[-1][1] == '{'
+        return self.path_stack and self.path_stack[-1][1] == '{'
 
     def has_brackets(self) -> bool:
         """Check if bracket stack is not empty."""
-        return bool(self._bracket_stack)
+        return bool(self.bracket_stack)
 
     def is_object_in_array(self) -> bool:
         """Check if we're an object directly inside an array.
@@ -128,9 +159,9 @@ class Tracker:
         the top is '{' (we're closing an object), and the one below is '['.
         """
         return (
-            len(self._bracket_stack) >= 2 and
-            self._bracket_stack[-1] == '{' and
-            self._bracket_stack[-2] == '['
+            len(self.bracket_stack) >= 2 and
+            self.bracket_stack[-1] == '{' and
+            self.bracket_stack[-2] == '['
         )
 
     def get_path(self, slice_index: int = None) -> str:
@@ -140,11 +171,12 @@ class Tracker:
         Args:
             slice_index: If provided, only use this many entries from the stack.
         """
-        stack = self._path_stack[:slice_index] if slice_index is not None else self._path_stack
-        if not stack:
-            return ''
-        names = [entry[0] for entry in stack if entry[0]]
-        return '/' + '/'.join(names)
+        if slice_index is None:
+            return self._paths[-1]
+        depth = len(self.path_stack)
+        if slice_index < 0:
+            return self._paths[max(depth + slice_index, 0)]
+        return self._paths[min(slice_index, depth)]
 
     def get_current_field_name(self) -> str:
         """
@@ -153,9 +185,9 @@ class Tracker:
         If we're in an array, returns the array's field name from path_stack.
         Otherwise returns the current field name being parsed.
         """
-        if self.in_array() and self._path_stack:
-            return self._path_stack[-1][0]
-        return self._field_name
+        if self.in_array() and self.path_stack:
+            return self.path_stack[-1][0]
+        return self.field_name
 
     # ========================================================================
     # CONTEXT BUFFER TRACKING
@@ -164,72 +196,63 @@ class Tracker:
     @property
     def content(self) -> str:
         """Get the current context content."""
-        return self._content
+        return self._materialize()
 
-    @property
-    def extractor(self) -> 'JSONExtractor':
-        """Get the JSON extractor for this tracker."""
-        if self._extractor is None:
-            self._extractor = _create_extractor(self)
-        return self._extractor
-
-    def append_to_context(self, char: str) -> int:
+    def append_to_context(self, text: str) -> int:
         """
-        Add a character to the context.
+        Add a character, or a run of characters, to the context.
 
         Returns:
             The number of characters trimmed (0 if none).
         """
-        self._content += char
-        trim_amount = self._trim_context_if_needed()
-        if trim_amount > 0:
-            self._adjust_array_starts(trim_amount)
-        return trim_amount
-
-    def _trim_context_if_needed(self) -> int:
+        self._chunks.append(text)
+        self.length += len(text)
+        self._cached = None
+        # Checked inline: this runs for every character the parser handles
+        if self.length <= 2 * self._max_size:
+            return 0
+        return self._trim_context()
+
+    def _trim_context(self) -> int:
         """
-        Trim the context if it exceeds max size.
+        Trim the context back to max size once it exceeds twice that.
 
         Returns:
             The number of characters that were trimmed.
         """
-        if len(self._content) > self._max_size:
-            trim_amount = len(self._content) - self._max_size
-            self._content = self._content[-self._max_size:]
-            return trim_amount
-        return 0
-
-    def _adjust_array_starts(self, trim_amount: int) -> None:
-        """
-        Adjust array start positions after context trimming.
-
-        Args:
-            trim_amount: Number of characters that were trimmed
-        """
-        # Update in-place by clearing and re-populating
-        to_keep = {}
-        for key, pos in self._array_starts.items():
-            if pos >= trim_amount:
-                to_keep[key] = pos - trim_amount
-        self._array_starts.clear()
-        self._array_starts.update(to_keep)
-
-    # ========================================================================
-    # DUCK-TYPING INTERFACE FOR EXTRACTOR
-    # ========================================================================
-
-    def __getitem__(self, key) -> str:
-        """Allow indexing/slicing into the context (for extractor)."""
-        return self._content[key]
-
-    def __len__(self) -> int:
-        """Return the length of the context (for extractor)."""
-        return len(self._content)
+        trim_amount = self.length - self._max_size
+
+        # Drop whole chunks from the front; a partially trimmed first
+        # chunk is only marked by _head and sliced when materialized.
+        remaining = trim_amount
+        chunks = self._chunks
+        while remaining > 0:
+            live = len(chunks[0]) - self._head
+            if live <= remaining:
+                chunks.popleft()
+                self._head = 0
+                remaining -= live
+            else:
+                self._head += remaining
+                remaining = 0
+
+        self.length = self._max_size
+        self.offset += trim_amount
+        return trim_amount
 
-    def __str__(self) -> str:
-        """Return the context as a string."""
-        return self._content
+    def _materialize(self) -> str:
+        """Join the context chunks into a string, caching the result."""
+        if self._cached is None:
+            chunks = self._chunks
+            if self._head:
+                chunks[0] = chunks[0][self._head:]
+                self._head = 0
+            self._cached = "".join(chunks)
+            # Collapse into one chunk so the next join only copies new text
+            chunks.clear()
+            chunks.append(self._cached)
+        return self._cached
 
     def __repr__(self) -> str:
         """Return a representation of the tracker."""
-        return f"Tracker({len(self._content)} chars, {len(self._bracket_stack)} brackets)"
+        return f"Tracker({self.length} chars, {len(self.bracket_stack)} brackets)"
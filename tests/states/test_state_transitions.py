@@ -598,6 +598,31 @@ class TestStateProperties:
         assert isinstance(parser.state, ValueStringState)
         assert parser.state.buffers is parser.buffers
 
+    def test_stateless_states_are_reused(self):
+        """Wait and root states are the same objects on every visit."""
+        parser = StreamingJSONParser()
+        parser.parse_incremental('{"a": 1')
+        first = parser.state
+        parser.parse_incremental(', "b": 2')
+        assert isinstance(parser.state, PrimitiveState)
+        assert parser.state is first
+
+        parser.parse_incremental('}')
+        root = parser.state
+        parser.parse_incremental('{}')
+        assert isinstance(parser.state, RootState)
+        assert parser.state is root
+
+    def test_reused_states_follow_assigned_handler(self):
+        """Reused states see a handler assigned after construction."""
+        parser = StreamingJSONParser()
+        handler = JSONParserHandler()
+        parser.handler = handler
+        parser.parse_incremental('{"a": [')
+
+        assert isinstance(parser.state, InArrayWaitState)
+        assert parser.state.handler is handler
+
 
 class TestEdgeCaseTransitions:
     """Test edge case state transitions."""
@@ -170,3 +170,112 @@ def test_reference_collection_pattern():
     # Check root reference
     root_refs = [r for r in handler.collected_refs if 'root.mdx' in r.get('filename', '')]
     assert len(root_refs) == 1
+
+
+def test_string_items_with_escaped_quotes():
+    """Test that string array items containing escaped quotes are extracted whole."""
+    data = {"tags": ['say "hi"', 'back\\slash\\', 'plain']}
+
+    json_str = json.dumps(data)
+
+    class ItemCollector(JSONParserHandler):
+        def __init__(self):
+            self.items = []
+
+        def on_array_item_end(self, path, field_name, item=None):
+            self.items.append(item)
+
+    handler = ItemCollector()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+
+    assert handler.items == ['say "hi"', 'back\\slash\\', 'plain']
+
+
+def test_long_primitive_items():
+    """Test that long numeric array items are extracted whole."""
+    big = 10 ** 120
+    data = {"nums": [big, -big, 1.5e300, 7]}
+
+    json_str = json.dumps(data)
+
+    class ItemCollector(JSONParserHandler):
+        def __init__(self):
+            self.items = []
+
+        def on_array_item_end(self, path, field_name, item=None):
+            self.items.append(item)
+
+    handler = ItemCollector()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+
+    assert handler.items == [big, -big, 1.5e300, 7]
+
+
+def test_object_items_beyond_context_window():
+    """Test that object items are extracted correctly after the context is trimmed."""
+    items = [{"id": i, "text": "brace } and { inside " + "x" * 50} for i in range(1500)]
+    data = {"items": items}
+
+    json_str = json.dumps(data)
+    assert len(json_str) > 100000
+
+    class ItemCollector(JSONParserHandler):
+        def __init__(self):
+            self.items = []
+
+        def on_array_item_end(self, path, field_name, item=None):
+            self.items.append(item)
+
+    handler = ItemCollector()
+    parser = StreamingJSONParser(handler)
+    for i in range(0, len(json_str), 7):
+        parser.parse_incremental(json_str[i:i + 7])
+
+    assert handler.items == items
+
+
+def test_array_values_after_context_trimmed():
+    """Test that array field values are extracted after many context trims."""
+    data = {
+        "first": [{"text": "y" * 40} for _ in range(3000)],
+        "nested": {"tags": ["a", "b"], "ids": [1, 2, 3]},
+    }
+    json_str = json.dumps(data)
+    assert len(json_str) > 100000
+
+    class ArrayCollector(JSONParserHandler):
+        def __init__(self):
+            self.arrays = {}
+
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            if isinstance(parsed_value, list):
+                self.arrays[field_name] = parsed_value
+
+    handler = ArrayCollector()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+
+    assert parser.tracker.offset > 0
+    assert handler.arrays["tags"] == ["a", "b"]
+    assert handler.arrays["ids"] == [1, 2, 3]
+
+
+def test_items_followed_by_long_whitespace():
+    """Test that items separated by long whitespace runs are still reported."""
+    pad = " \n\t" * 100
+    json_str = '{"items": ["a"' + pad + ', "c"' + pad + ', {"b": 2}' + pad + ']' + pad + '}'
+
+    class ItemCollector(JSONParserHandler):
+        def __init__(self):
+            self.items = []
+
+        def on_array_item_end(self, path, field_name, item=None):
+            self.items.append(item)
+
+    handler = ItemCollector()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+
+    assert handler.items == ["a", "c", {"b": 2}]
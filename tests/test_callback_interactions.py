@@ -1,6 +1,7 @@
 """Test interactions between different callbacks and event sequences."""
 
 from jaxn import StreamingJSONParser, JSONParserHandler
+from jaxn import states
 import json
 
 
@@ -419,6 +420,167 @@ def test_field_end_called_after_all_chunks():
     assert all('chunk:' in e for e in events[:-1])
 
 
+def test_repeated_field_names_are_same_object():
+    """Test that a field name repeated across objects is reported as one string object."""
+    data = [{"title": "a"}, {"title": "b"}]
+    json_str = json.dumps({"items": data})
+    
+    names = []
+    
+    class EventTracker(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            if field_name == 'title':
+                names.append(field_name)
+    
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert len(names) == 2
+    assert names[0] is names[1]
+
+
+def test_repeated_paths_are_same_object():
+    """Test that a path repeated across array items is reported as one string object."""
+    data = [{"meta": {"x": 1}}, {"meta": {"x": 2}}]
+    json_str = json.dumps({"items": data})
+    
+    paths = []
+    
+    class EventTracker(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            if field_name == 'x':
+                paths.append(path)
+    
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert paths == ['/items/meta', '/items/meta']
+    assert paths[0] is paths[1]
+
+
+
+def test_callbacks_overridden_in_base_subclass():
+    """Test that callbacks inherited from an intermediate handler class are called."""
+    json_str = json.dumps({"items": [{"a": 1}, 2], "text": "hi"})
+    
+    events = []
+    
+    class BaseTracker(JSONParserHandler):
+        def on_array_item_end(self, path, field_name, item=None):
+            events.append(('item', item))
+        
+        def on_value_chunk(self, path, field_name, chunk):
+            events.append(('chunk', chunk))
+    
+    class EventTracker(BaseTracker):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            events.append(('end', field_name))
+    
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert ('item', {"a": 1}) in events
+    assert ('item', 2) in events
+    assert [e[1] for e in events if e[0] == 'chunk'] == ['h', 'i']
+    assert ('end', 'text') in events
+
+
+
+def test_chunk_only_handler_keeps_no_context():
+    """Test that a handler without end callbacks streams chunks without keeping context."""
+    json_str = json.dumps({"items": ["ab", {"c": "d"}], "text": "hi"})
+    
+    chunks = []
+    
+    class ChunkTracker(JSONParserHandler):
+        def on_value_chunk(self, path, field_name, chunk):
+            chunks.append((field_name, chunk))
+    
+    handler = ChunkTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert chunks == [('items', 'a'), ('items', 'b'), ('c', 'd'), ('text', 'h'), ('text', 'i')]
+    assert parser.tracker.length == 0
+
+
+def test_chunk_only_handler_decodes_no_values():
+    """Test that field values are not decoded when nothing receives on_field_end."""
+    json_str = '{"a": "x\\ny", "b": 1.5, "c": true}'
+    
+    chunks = []
+    
+    class ChunkTracker(JSONParserHandler):
+        def on_value_chunk(self, path, field_name, chunk):
+            chunks.append(chunk)
+    
+    def fail(*args):
+        raise AssertionError("value decoded without a receiver")
+    
+    saved = states.parse_primitive, states._scanstring
+    states.parse_primitive = states._scanstring = fail
+    try:
+        parser = StreamingJSONParser(ChunkTracker())
+        parser.parse_incremental(json_str)
+    finally:
+        states.parse_primitive, states._scanstring = saved
+    
+    assert ''.join(chunks) == 'x\ny'
+
+
+def test_context_only_keeps_text_inside_arrays():
+    """Test that text outside arrays is not kept while array callbacks still work."""
+    json_str = json.dumps({"text": "x" * 1000, "items": [{"a": 1}, "b"], "n": 5})
+    
+    events = []
+    
+    class EndTracker(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            events.append(('field_end', field_name, parsed_value))
+        
+        def on_array_item_end(self, path, field_name, item=None):
+            events.append(('item_end', field_name, item))
+    
+    handler = EndTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert events == [
+        ('field_end', 'text', 'x' * 1000),
+        ('field_end', 'a', 1),
+        ('item_end', 'items', {"a": 1}),
+        ('item_end', 'items', 'b'),
+        ('field_end', 'items', [{"a": 1}, "b"]),
+        ('field_end', 'n', 5),
+    ]
+    assert parser.tracker.length == len('[{"a": 1}, "b"]')
+
+
+def test_assigned_handler_receives_callbacks():
+    """Test that a handler assigned after construction gets every callback it overrides."""
+    events = []
+    
+    class EventTracker(JSONParserHandler):
+        def on_value_chunk(self, path, field_name, chunk):
+            events.append(('chunk', field_name, chunk))
+        
+        def on_array_item_end(self, path, field_name, item=None):
+            events.append(('item_end', field_name, item))
+    
+    parser = StreamingJSONParser()
+    parser.handler = EventTracker()
+    parser.parse_incremental('{"a": "xy", "items": [1]}')
+    
+    assert events == [
+        ('chunk', 'a', 'x'),
+        ('chunk', 'a', 'y'),
+        ('item_end', 'items', 1),
+    ]
+
+
 if __name__ == "__main__":
     # Run all tests
     test_field_start_before_string_value()
@@ -463,4 +625,25 @@ if __name__ == "__main__":
     test_field_end_called_after_all_chunks()
     print("✅ test_field_end_called_after_all_chunks passed")
     
+    test_repeated_field_names_are_same_object()
+    print("✅ test_repeated_field_names_are_same_object passed")
+    
+    test_repeated_paths_are_same_object()
+    print("✅ test_repeated_paths_are_same_object passed")
+    
+    test_callbacks_overridden_in_base_subclass()
+    print("✅ test_callbacks_overridden_in_base_subclass passed")
+    
+    test_chunk_only_handler_keeps_no_context()
+    print("✅ test_chunk_only_handler_keeps_no_context passed")
+    
+    test_chunk_only_handler_decodes_no_values()
+    print("✅ test_chunk_only_handler_decodes_no_values passed")
+    
+    test_context_only_keeps_text_inside_arrays()
+    print("✅ test_context_only_keeps_text_inside_arrays passed")
+    
+    test_assigned_handler_receives_callbacks()
+    print("✅ test_assigned_handler_receives_callbacks passed")
+    
     print("\n🎉 All callback interaction tests passed!")
@@ -1,6 +1,7 @@
 """Test edge cases and special scenarios not covered by other tests."""
 
 from jaxn import StreamingJSONParser, JSONParserHandler
+from jaxn.states import RootState
 import json
 
 
@@ -295,6 +296,35 @@ def test_parser_reuse():
     assert 'Bob' in captured
 
 
+def test_parser_reset_between_documents():
+    """Test that reset() drops an unfinished document before the next one."""
+    events = []
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            events.append((path, field_name, parsed_value))
+        
+        def on_array_item_end(self, path, field_name, item=None):
+            events.append(('item', path, field_name, item))
+    
+    handler = TestHandler()
+    parser = StreamingJSONParser(handler)
+    
+    parser.parse_incremental(b'{"outer": {"items": [{"a": "caf\xc3')
+    parser.reset()
+    assert isinstance(parser.state, RootState)
+    assert parser.tracker.bracket_stack == []
+    
+    parser.parse_incremental('{"items": [1, 2], "name": "Bob"}')
+    
+    assert events == [
+        ('item', '', 'items', 1),
+        ('item', '', 'items', 2),
+        ('', 'items', [1, 2]),
+        ('', 'name', 'Bob'),
+    ]
+
+
 def test_very_long_string_value():
     """Test parsing with a very long string value."""
     long_string = "a" * 10000  # 10,000 characters
@@ -403,6 +433,26 @@ def test_numbers_and_booleans_in_arrays():
     assert ('start', 'mixed') in events
 
 
+def test_arrays_nested_in_arrays():
+    """Test that an array directly inside an array ends with its own value."""
+    json_str = '{"b": [0.0], "c": {"d": [[], true]}}'
+    
+    events = []
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            events.append((path, field_name, value, parsed_value))
+    
+    parser = StreamingJSONParser(TestHandler())
+    parser.parse_incremental(json_str)
+    
+    # The inner array must not be read from an earlier array's position
+    assert events == [
+        ('', 'b', '0.0', [0.0]),
+        ('/c/d', '', '', []),
+        ('/c', 'd', '[], true', [[], True]),
+    ]
+
 def test_parse_from_old_new_with_invalid_input():
     """Test parse_from_old_new with invalid inputs."""
     captured = []
@@ -486,6 +536,76 @@ def test_consecutive_escape_sequences():
     assert result.count('\t') == 3
 
 
+def test_primitive_field_values_parsed():
+    """Test parsed values of primitive fields, including ones that are not valid JSON."""
+    json_str = '{"a": 42, "b": -7, "c": 0, "d": 1.5e3, "e": true, "f": false, "g": null, "h": 007}'
+    
+    captured = []
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            captured.append((field_name, value, parsed_value))
+    
+    handler = TestHandler()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental(json_str)
+    
+    assert captured == [
+        ('a', '42', 42),
+        ('b', '-7', -7),
+        ('c', '0', 0),
+        ('d', '1.5e3', 1500.0),
+        ('e', 'true', True),
+        ('f', 'false', False),
+        ('g', 'null', None),
+        ('h', '007', '007'),
+    ]
+    assert type(captured[0][2]) is int
+
+
+def test_integer_over_digit_limit_in_array():
+    """Test that an array integer too long for int() does not stop parsing."""
+    big = '1' * 5000
+    
+    for json_str in ['{"a": [%s], "n": 1}' % big, '{"a": [{"b": %s}], "n": 1}' % big]:
+        captured = {}
+        items = []
+        
+        class TestHandler(JSONParserHandler):
+            def on_field_end(self, path, field_name, value, parsed_value=None):
+                captured[field_name] = parsed_value
+            
+            def on_array_item_end(self, path, field_name, item=None):
+                items.append(item)
+        
+        parser = StreamingJSONParser(TestHandler())
+        parser.parse_incremental(json_str)
+        
+        # The value cannot be decoded, so the array has no parsed value
+        assert captured['a'] is None
+        assert captured['n'] == 1
+        assert items == []
+
+
+def test_arrays_nested_beyond_recursion_limit():
+    """Test that arrays nested deeper than the recursion limit do not stop parsing."""
+    # 1200 levels of arrays holding objects
+    depth = 600
+    json_str = '{"a": %s, "n": 1}' % ('[{"x": ' * depth + '1' + '}]' * depth)
+    
+    captured = {}
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            captured[field_name] = parsed_value
+    
+    parser = StreamingJSONParser(TestHandler())
+    parser.parse_incremental(json_str)
+    
+    assert captured['a'] is None
+    assert captured['n'] == 1
+
+
 if __name__ == "__main__":
     # Run all tests
     test_empty_root_object()
@@ -521,6 +641,9 @@ if __name__ == "__main__":
     test_parser_reuse()
     print("✅ test_parser_reuse passed")
     
+    test_parser_reset_between_documents()
+    print("✅ test_parser_reset_between_documents passed")
+    
     test_very_long_string_value()
     print("✅ test_very_long_string_value passed")
     
@@ -533,6 +656,9 @@ if __name__ == "__main__":
     test_numbers_and_booleans_in_arrays()
     print("✅ test_numbers_and_booleans_in_arrays passed")
     
+    test_arrays_nested_in_arrays()
+    print("✅ test_arrays_nested_in_arrays passed")
+    
     test_parse_from_old_new_with_invalid_input()
     print("✅ test_parse_from_old_new_with_invalid_input passed")
     
@@ -545,4 +671,13 @@ if __name__ == "__main__":
     test_consecutive_escape_sequences()
     print("✅ test_consecutive_escape_sequences passed")
     
+    test_primitive_field_values_parsed()
+    print("✅ test_primitive_field_values_parsed passed")
+    
+    test_integer_over_digit_limit_in_array()
+    print("✅ test_integer_over_digit_limit_in_array passed")
+    
+    test_arrays_nested_beyond_recursion_limit()
+    print("✅ test_arrays_nested_beyond_recursion_limit passed")
+    
     print("\n🎉 All edge case tests passed!")
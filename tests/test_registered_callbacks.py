@@ -0,0 +1,46 @@
+"""Test callbacks registered for a single path and field name."""
+
+from jaxn import StreamingJSONParser, JSONParserHandler
+import json
+
+
+def test_registered_callback_receives_matching_fields():
+    """Test that a registered callback fires only for its path and field name."""
+    data = {
+        "title": "Top",
+        "sections": [
+            {"title": "One", "tags": ["a", "b"]},
+            {"title": "Two", "tags": []},
+        ],
+    }
+    json_str = json.dumps(data)
+
+    titles = []
+    tags = []
+
+    parser = StreamingJSONParser()
+    parser.register('/sections', 'title', lambda value, parsed: titles.append(parsed))
+    parser.register('/sections', 'tags', lambda value, parsed: tags.append((value, parsed)))
+    parser.parse_incremental(json_str)
+
+    assert titles == ['One', 'Two']
+    assert tags == [('"a", "b"', ['a', 'b']), ('', [])]
+
+
+def test_registered_callback_and_handler_both_called():
+    """Test that the handler still gets on_field_end for registered fields."""
+    events = []
+
+    class EventTracker(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            events.append(('handler', field_name, parsed_value))
+
+    parser = StreamingJSONParser(EventTracker())
+    parser.register('', 'count', lambda value, parsed: events.append(('rule', value, parsed)))
+    parser.parse_incremental('{"count": 3, "name": "x"}')
+
+    assert events == [
+        ('handler', 'count', 3),
+        ('rule', '3', 3),
+        ('handler', 'name', 'x'),
+    ]
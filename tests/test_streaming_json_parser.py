@@ -288,6 +288,39 @@ def test_parse_from_old_new():
     assert ("city", "NYC") in captured_fields
 
 
+def test_parse_append():
+    """Test parse_append with the whole text received so far."""
+    data = {"name": "Alice", "tags": ["a", "b"]}
+    json_str = json.dumps(data)
+    
+    captured_fields = []
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            captured_fields.append((field_name, parsed_value))
+    
+    parser = StreamingJSONParser(TestHandler())
+    
+    # Simulate a growing response, sometimes without new text
+    for i in range(0, len(json_str) + 1, 3):
+        parser.parse_append(json_str[:i])
+        parser.parse_append(json_str[:i])
+    parser.parse_append(json_str)
+    
+    assert captured_fields == [("name", "Alice"), ("tags", ["a", "b"])]
+    
+    try:
+        parser.parse_append(json_str[:5])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    # A new document starts from the beginning again
+    parser.reset()
+    parser.parse_append('{"x": 1}')
+    assert captured_fields[-1] == ("x", 1)
+
+
 def test_field_start_callback():
     """Test that on_field_start is called when entering a field value."""
     data = {"status": "active", "count": "42"}
@@ -359,6 +392,36 @@ def test_large_json_random_chunks():
         assert ("content", f"This is the content for section {i} with some details.") in captured_fields
 
 
+def test_bytes_input_split_inside_multibyte_characters():
+    """Test parsing UTF-8 bytes delivered in chunks that split multi-byte characters."""
+    data = {"title": "Grüße 世界 😀", "tags": ["café", "naïve"]}
+    json_bytes = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    
+    captured_fields = {}
+    
+    class TestHandler(JSONParserHandler):
+        def on_field_end(self, context, field_name, value, parsed_value=None):
+            captured_fields[field_name] = parsed_value
+    
+    parser = StreamingJSONParser(TestHandler())
+    for i in range(0, len(json_bytes), 3):
+        parser.parse_incremental(json_bytes[i:i + 3])
+    
+    assert captured_fields == data
+    
+    # A memoryview over one reused buffer, as filled by recv_into
+    captured_fields.clear()
+    parser = StreamingJSONParser(TestHandler())
+    buffer = bytearray(5)
+    view = memoryview(buffer)
+    for i in range(0, len(json_bytes), 5):
+        piece = json_bytes[i:i + 5]
+        buffer[:len(piece)] = piece
+        parser.parse_incremental(view[:len(piece)])
+    
+    assert captured_fields == data
+
+
 def test_search_result_article_formatting():
     """
     Comprehensive test that simulates the real use case:
@@ -553,12 +616,18 @@ if __name__ == "__main__":
     test_parse_from_old_new()
     print("✅ test_parse_from_old_new passed")
     
+    test_parse_append()
+    print("✅ test_parse_append passed")
+    
     test_field_start_callback()
     print("✅ test_field_start_callback passed")
     
     test_large_json_random_chunks()
     print("✅ test_large_json_random_chunks passed")
     
+    test_bytes_input_split_inside_multibyte_characters()
+    print("✅ test_bytes_input_split_inside_multibyte_characters passed")
+    
     test_search_result_article_formatting()
     print("✅ test_search_result_article_formatting passed")
     
@@ -1,6 +1,7 @@
 r"""Test unicode escape sequence handling (\uXXXX format)."""
 
 from jaxn import StreamingJSONParser, JSONParserHandler
+from jaxn.buffers import Buffers
 import json
 
 
@@ -154,3 +155,65 @@ def test_invalid_unicode_escape():
     
     # Since the JSON itself is invalid, the parsed_value may not decode correctly
     # This is expected behavior - the parser handles it gracefully
+
+
+def test_unicode_escape_surrogate_pairs():
+    """Test that an escaped surrogate pair is decoded to one character."""
+    json_str = '{"\\ud83d\\ude00": "a\\ud83d\\ude00b", "lone": "\\ud83dx"}'
+    
+    class TestHandler(JSONParserHandler):
+        def __init__(self):
+            self.chunks = []
+            self.fields = []
+        
+        def on_value_chunk(self, path, field_name, chunk):
+            self.chunks.append(chunk)
+        
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            self.fields.append((field_name, parsed_value))
+    
+    # Also split the input inside the escapes
+    for step in (len(json_str), 3):
+        handler = TestHandler()
+        parser = StreamingJSONParser(handler)
+        for i in range(0, len(json_str), step):
+            parser.parse_incremental(json_str[i:i + step])
+        
+        assert handler.chunks == ['a', '\U0001F600', 'b', '\ud83d', 'x']
+        assert handler.fields == [('\U0001F600', 'a\U0001F600b'), ('lone', '\ud83dx')]
+
+
+def test_escaped_surrogate_pairs_read_only_buffer_tail():
+    """Test that pairing escaped surrogates does not read the whole value buffer."""
+    
+    class TestHandler(JSONParserHandler):
+        def __init__(self):
+            self.final_value = None
+        
+        def on_field_end(self, path, field_name, value, parsed_value=None):
+            self.final_value = parsed_value
+    
+    buffer_property = Buffers.buffer
+    reads = [0]
+    
+    def counting_buffer(self):
+        reads[0] += 1
+        return buffer_property.fget(self)
+    
+    def count_buffer_reads(count):
+        # json.dumps escapes each emoji as a \ud83d\ude00 pair
+        json_str = json.dumps({"content": "\U0001F600" * count})
+        handler = TestHandler()
+        parser = StreamingJSONParser(handler)
+        reads[0] = 0
+        Buffers.buffer = property(counting_buffer, buffer_property.fset)
+        try:
+            parser.parse_incremental(json_str)
+        finally:
+            Buffers.buffer = buffer_property
+        assert handler.final_value == "\U0001F600" * count
+        return reads[0]
+    
+    # Only the field name and the finished value are read in full, however
+    # many pairs the value holds
+    assert count_buffer_reads(1) == count_buffer_reads(100) == 2
@@ -0,0 +1,90 @@
+"""Test batching of on_value_chunk callbacks with chunk_size."""
+
+from jaxn import StreamingJSONParser, JSONParserHandler
+import json
+
+
+class EventTracker(JSONParserHandler):
+    def __init__(self):
+        self.events = []
+
+    def on_value_chunk(self, path, field_name, chunk):
+        self.events.append(('chunk', path, field_name, chunk))
+
+    def on_field_end(self, path, field_name, value, parsed_value=None):
+        self.events.append(('end', path, field_name, parsed_value))
+
+
+def test_chunks_batched_up_to_chunk_size():
+    """Test that characters are delivered in chunks of chunk_size."""
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler, chunk_size=4)
+    parser.parse_incremental('{"text": "ABCDEFGHIJ"}')
+
+    assert handler.events == [
+        ('chunk', '', 'text', 'ABCD'),
+        ('chunk', '', 'text', 'EFGH'),
+        ('chunk', '', 'text', 'IJ'),
+        ('end', '', 'text', 'ABCDEFGHIJ'),
+    ]
+
+
+def test_chunks_flushed_at_end_of_delta():
+    """Test that pending characters are delivered when a delta is consumed."""
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler, chunk_size=100)
+
+    parser.parse_incremental('{"text": "Hel')
+    assert handler.events == [('chunk', '', 'text', 'Hel')]
+
+    parser.parse_incremental('lo"}')
+    assert handler.events == [
+        ('chunk', '', 'text', 'Hel'),
+        ('chunk', '', 'text', 'lo'),
+        ('end', '', 'text', 'Hello'),
+    ]
+
+
+def test_batched_chunks_contain_decoded_escapes():
+    """Test that escape sequences are decoded inside batched chunks."""
+    data = {"items": ["a\nb", "café \"x\""], "text": "tab\there"}
+    json_str = json.dumps(data)
+
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler, chunk_size=1000)
+    parser.parse_incremental(json_str)
+
+    chunks = [e for e in handler.events if e[0] == 'chunk']
+    assert chunks == [
+        ('chunk', '/items', 'items', 'a\nb'),
+        ('chunk', '/items', 'items', 'café "x"'),
+        ('chunk', '', 'text', 'tab\there'),
+    ]
+
+
+def test_default_chunk_size_is_per_character():
+    """Test that without chunk_size every character is its own chunk."""
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler)
+    parser.parse_incremental('{"text": "abc"}')
+
+    chunks = [e[3] for e in handler.events if e[0] == 'chunk']
+    assert chunks == ['a', 'b', 'c']
+
+
+def test_chunk_size_none_delivers_whole_strings():
+    """Test that chunk_size=None delivers each string in one call when it ends."""
+    handler = EventTracker()
+    parser = StreamingJSONParser(handler, chunk_size=None)
+
+    parser.parse_incremental('{"text": "Hel')
+    assert handler.events == []
+
+    parser.parse_incremental('lo", "tags": ["a\\nb", "c"]}')
+    assert handler.events == [
+        ('chunk', '', 'text', 'Hello'),
+        ('end', '', 'text', 'Hello'),
+        ('chunk', '/tags', 'tags', 'a\nb'),
+        ('chunk', '/tags', 'tags', 'c'),
+        ('end', '', 'tags', ['a\nb', 'c']),
+    ]